@@ -4,18 +4,56 @@ Enterprise-grade AI Summarization Platform
 """
 import streamlit as st
 from pathlib import Path
+import io
 import sys
+import shutil
 import time
 from datetime import datetime
+import orjson
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add src to path (once per process, the script re-runs on every interaction)
+PROJECT_ROOT = str(Path(__file__).parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from config.settings import settings, UPLOAD_DIR
+from src.utils.async_runner import run_async
+from src.utils.hashing import content_hash
+
+
+# Heavy modules (pdf backends, LangChain, Groq clients) are imported and
+# built once per process instead of on every Streamlit rerun
+@st.cache_resource
+def get_llm_manager():
+    """Shared LLM manager with the persistent response cache installed"""
+    from src.models.llm_cache import configure_llm_cache
+    from src.models.llm_manager import llm_manager
+    
+    # Serve repeated LLM prompts from the persistent cache
+    configure_llm_cache()
+    return llm_manager
+
+
+@st.cache_resource
+def get_summarizer(model_name: str):
+    """Shared multi-level summarizer for a model"""
+    from src.strategies.summarization_strategies import MultiLevelSummarizer
+    get_llm_manager()
+    return MultiLevelSummarizer(model_name=model_name)
+
+
+@st.cache_data
+def load_css() -> str:
+    """Load the app stylesheet once instead of rebuilding it on every rerun"""
+    return (Path(__file__).parent / "static" / "theme.css").read_text(encoding="utf-8")
+
+
+@st.cache_resource
+def get_chunker(chunk_size: int, chunk_overlap: int):
+    """Shared chunking engine, so the tokenizer is loaded once"""
+    from src.core.chunking_engine import ChunkingEngine
+    return ChunkingEngine(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
 
-from config.settings import settings
-from src.processors.document_processor import DocumentProcessorFactory
-from src.core.chunking_engine import ChunkingEngine
-from src.strategies.summarization_strategies import MultiLevelSummarizer, StrategySelectorr
-from src.models.llm_manager import llm_manager
 
 # Page configuration
 st.set_page_config(
@@ -26,93 +64,7 @@ st.set_page_config(
 )
 
 # Custom CSS for enterprise look
-st.markdown("""
-<style>
-    /* Main theme */
-    .stApp {
-        background-color: #0E1117;
-    }
-    
-    /* Headers */
-    h1 {
-        color: #FFFFFF;
-        font-weight: 700;
-        letter-spacing: -0.5px;
-    }
-    
-    h2, h3 {
-        color: #E0E0E0;
-        font-weight: 600;
-    }
-    
-    /* Cards and containers */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 8px;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        background-color: #1E1E1E;
-        border-radius: 4px;
-        padding: 8px 16px;
-        color: #A0A0A0;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background-color: #2E7D32;
-        color: #FFFFFF;
-    }
-    
-    /* Buttons */
-    .stButton > button {
-        background-color: #2E7D32;
-        color: white;
-        border-radius: 4px;
-        padding: 0.5rem 2rem;
-        font-weight: 500;
-        border: none;
-        transition: all 0.3s;
-    }
-    
-    .stButton > button:hover {
-        background-color: #388E3C;
-        box-shadow: 0 4px 12px rgba(46, 125, 50, 0.3);
-    }
-    
-    /* File uploader */
-    .uploadedFile {
-        background-color: #1E1E1E;
-        border-radius: 8px;
-        padding: 1rem;
-    }
-    
-    /* Metrics */
-    [data-testid="stMetricValue"] {
-        font-size: 2rem;
-        color: #2E7D32;
-    }
-    
-    /* Progress bar */
-    .stProgress > div > div {
-        background-color: #2E7D32;
-    }
-    
-    /* Sidebar */
-    .css-1d391kg {
-        background-color: #1A1A1A;
-    }
-    
-    /* Success/Info boxes */
-    .stSuccess {
-        background-color: #1B5E20;
-        border-left: 4px solid #2E7D32;
-    }
-    
-    .stInfo {
-        background-color: #0D47A1;
-        border-left: 4px solid #1976D2;
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
 
 
 def init_session_state():
@@ -125,6 +77,10 @@ def init_session_state():
         st.session_state.summaries = None
     if 'processing' not in st.session_state:
         st.session_state.processing = False
+    if 'generated_at' not in st.session_state:
+        st.session_state.generated_at = None
+    if 'summarized_filename' not in st.session_state:
+        st.session_state.summarized_filename = None
 
 
 def render_header():
@@ -156,6 +112,7 @@ def render_sidebar():
         
         # Model selection
         st.subheader("Model Configuration")
+        llm_manager = get_llm_manager()
         available_models = list(llm_manager.list_available_models().keys())
         selected_model = st.selectbox(
             "Select Model",
@@ -220,50 +177,74 @@ def render_sidebar():
         }
 
 
-def process_document(uploaded_file, settings_dict):
-    """Process uploaded document"""
-    
-    # Save uploaded file temporarily
-    temp_path = Path("data/uploads") / uploaded_file.name
-    temp_path.parent.mkdir(parents=True, exist_ok=True)
+@st.cache_data(
+    ttl=settings.cache_ttl_hours * 3600,
+    max_entries=128,
+    show_spinner="📖 Processing and chunking document...",
+    hash_funcs={bytes: content_hash}
+)
+def process_and_chunk(
+    file_bytes: bytes,
+    filename: str,
+    chunk_size: int,
+    chunk_overlap: int,
+    extract_tables: bool
+):
+    """Parse and chunk a document, cached on file content and processing parameters"""
+    from src.processors.document_processor import DocumentProcessorFactory
+    
+    processed_doc = DocumentProcessorFactory.process_stream(
+        io.BytesIO(file_bytes), filename, extract_tables=extract_tables
+    )
     
-    with open(temp_path, "wb") as f:
-        f.write(uploaded_file.getbuffer())
+    chunker = get_chunker(chunk_size, chunk_overlap)
+    chunked = chunker.chunk_document(processed_doc, strategy="smart")
     
-    # Process document
-    with st.spinner("📖 Processing document..."):
-        processed_doc = DocumentProcessorFactory.process_document(temp_path)
-        st.session_state.processed_doc = processed_doc
+    return processed_doc, chunked
+
+
+def process_document(uploaded_file, settings_dict):
+    """Process uploaded document"""
     
-    # Chunk document
-    with st.spinner("✂️ Chunking document..."):
-        chunker = ChunkingEngine(
-            chunk_size=settings_dict['chunk_size'],
-            chunk_overlap=settings_dict['chunk_overlap']
-        )
-        chunks = chunker.chunk_document(processed_doc, strategy="smart")
-        st.session_state.chunks = chunks
+    # Optionally keep a copy of the upload (streamed in 1MB blocks)
+    if settings.persist_uploads and settings.storage_type == "local":
+        saved_path = UPLOAD_DIR / uploaded_file.name
+        uploaded_file.seek(0)
+        with open(saved_path, "wb") as f:
+            shutil.copyfileobj(uploaded_file, f, length=1024 * 1024)
+    
+    # Parse and chunk (served from cache for previously seen content)
+    processed_doc, chunked = process_and_chunk(
+        uploaded_file.getvalue(),
+        uploaded_file.name,
+        settings_dict['chunk_size'],
+        settings_dict['chunk_overlap'],
+        settings.enable_table_extraction
+    )
+    st.session_state.processed_doc = processed_doc
+    st.session_state.chunks = chunked.chunks
     
-    return processed_doc, chunks
+    return processed_doc, chunked.chunks, chunked.total_tokens
 
 
 def generate_summaries(chunks, total_tokens, settings_dict):
     """Generate all summary levels"""
     
-    summarizer = MultiLevelSummarizer(model_name=settings_dict['model'])
+    summarizer = get_summarizer(settings_dict['model'])
     
     progress_bar = st.progress(0)
     status_text = st.empty()
     
     # Generate summaries with progress updates
-    status_text.text("🤖 Generating TL;DR...")
+    status_text.text("🤖 Generating all summary levels...")
     progress_bar.progress(25)
     
-    summaries = summarizer.generate_all_summaries(
+    # All four levels are generated concurrently on the async event loop
+    summaries = run_async(summarizer.agenerate_all_summaries(
         chunks,
         total_tokens,
         style=settings_dict['style']
-    )
+    ))
     
     progress_bar.progress(100)
     status_text.text("✅ All summaries generated!")
@@ -291,11 +272,16 @@ def render_document_upload():
             st.info(f"📄 **{uploaded_file.name}**")
         
         with col2:
-            file_size = len(uploaded_file.getvalue()) / (1024 * 1024)
+            file_size = uploaded_file.size / (1024 * 1024)
             st.metric("Size", f"{file_size:.2f} MB")
         
         with col3:
             st.metric("Type", uploaded_file.type.split('/')[-1].upper())
+        
+        # Reject oversized uploads before any of their bytes are read
+        if file_size > settings.max_file_size_mb:
+            st.error(f"❌ File exceeds the {settings.max_file_size_mb} MB limit")
+            return None
     
     return uploaded_file
 
@@ -374,66 +360,98 @@ def render_summaries(summaries):
             st.caption(f"Model: {summaries['detailed'].model_used}")
 
 
+@st.cache_data(
+    ttl=settings.cache_ttl_hours * 3600,
+    max_entries=32,
+    show_spinner=False
+)
+def build_markdown_export(rows, filename: str, generated_at: datetime) -> str:
+    """Build the Markdown export for a set of summary rows"""
+    parts = [
+        f"# Summaries for {filename}\n",
+        f"Generated on: {generated_at.strftime('%Y-%m-%d %H:%M')}\n",
+    ]
+    for summary_type, content, _, _ in rows:
+        parts.append(f"## {summary_type.upper()}\n")
+        parts.append(f"{content}\n")
+        parts.append("---\n")
+    return "\n".join(parts) + "\n"
+
+
+@st.cache_data(
+    ttl=settings.cache_ttl_hours * 3600,
+    max_entries=32,
+    show_spinner=False
+)
+def build_text_export(rows, filename: str, generated_at: datetime) -> str:
+    """Build the plain text export for a set of summary rows"""
+    parts = [
+        f"SUMMARIES FOR: {filename}",
+        f"Generated: {generated_at.strftime('%Y-%m-%d %H:%M')}",
+        "=" * 60 + "\n",
+    ]
+    for summary_type, content, _, _ in rows:
+        parts.append(summary_type.upper())
+        parts.append("-" * 60)
+        parts.append(f"{content}\n")
+    return "\n".join(parts) + "\n"
+
+
+@st.cache_data(
+    ttl=settings.cache_ttl_hours * 3600,
+    max_entries=32,
+    show_spinner=False
+)
+def build_json_export(rows, filename: str, generated_at: datetime) -> bytes:
+    """Build the JSON export for a set of summary rows"""
+    json_data = {
+        'filename': filename,
+        'generated_at': generated_at.isoformat(),
+        'summaries': {
+            summary_type: {
+                'content': content,
+                'strategy': strategy,
+                'model': model
+            } for summary_type, content, strategy, model in rows
+        }
+    }
+    return orjson.dumps(json_data, option=orjson.OPT_INDENT_2)
+
+
 def render_export_options(summaries, filename):
     """Render export options"""
     st.header("💾 Export")
     
+    # Hashable snapshot of the summaries, used as the export cache key
+    rows = tuple(
+        (k, v.content, v.strategy_used, v.model_used) for k, v in summaries.items()
+    )
+    generated_at = st.session_state.generated_at or datetime.now()
+    stem = Path(filename).stem
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        # Export all summaries as Markdown
-        md_content = f"# Summaries for {filename}\n\n"
-        md_content += f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n"
-        
-        for summary_type, summary in summaries.items():
-            md_content += f"## {summary_type.upper()}\n\n"
-            md_content += f"{summary.content}\n\n"
-            md_content += "---\n\n"
-        
         st.download_button(
             "📄 Download Markdown",
-            data=md_content,
-            file_name=f"{Path(filename).stem}_summaries.md",
+            data=build_markdown_export(rows, filename, generated_at),
+            file_name=f"{stem}_summaries.md",
             mime="text/markdown"
         )
     
     with col2:
-        # Export as plain text
-        txt_content = f"SUMMARIES FOR: {filename}\n"
-        txt_content += f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n"
-        txt_content += "=" * 60 + "\n\n"
-        
-        for summary_type, summary in summaries.items():
-            txt_content += f"{summary_type.upper()}\n"
-            txt_content += "-" * 60 + "\n"
-            txt_content += f"{summary.content}\n\n"
-        
         st.download_button(
             "📝 Download Text",
-            data=txt_content,
-            file_name=f"{Path(filename).stem}_summaries.txt",
+            data=build_text_export(rows, filename, generated_at),
+            file_name=f"{stem}_summaries.txt",
             mime="text/plain"
         )
     
     with col3:
-        # Export as JSON
-        import json
-        json_data = {
-            'filename': filename,
-            'generated_at': datetime.now().isoformat(),
-            'summaries': {
-                k: {
-                    'content': v.content,
-                    'strategy': v.strategy_used,
-                    'model': v.model_used
-                } for k, v in summaries.items()
-            }
-        }
-        
         st.download_button(
             "🔧 Download JSON",
-            data=json.dumps(json_data, indent=2),
-            file_name=f"{Path(filename).stem}_summaries.json",
+            data=build_json_export(rows, filename, generated_at),
+            file_name=f"{stem}_summaries.json",
             mime="application/json"
         )
 
@@ -460,12 +478,11 @@ def main():
         # Process button
         if st.button("🚀 Process & Summarize", type="primary", use_container_width=True):
             try:
-                # Process document
-                processed_doc, chunks = process_document(uploaded_file, settings_dict)
-                
-                # Calculate total tokens
-                chunker = ChunkingEngine()
-                total_tokens = sum(chunk.token_count for chunk in chunks)
+                # Process document (token total is computed while chunking)
+                processed_doc, chunks, total_tokens = process_document(
+                    uploaded_file,
+                    settings_dict
+                )
                 
                 # Display document info
                 st.success("✅ Document processed successfully!")
@@ -477,6 +494,8 @@ def main():
                 st.header("🤖 Generating Summaries...")
                 summaries = generate_summaries(chunks, total_tokens, settings_dict)
                 st.session_state.summaries = summaries
+                st.session_state.generated_at = datetime.now()
+                st.session_state.summarized_filename = uploaded_file.name
                 
             except Exception as e:
                 st.error(f"❌ Error processing document: {str(e)}")
@@ -488,7 +507,9 @@ def main():
         render_summaries(st.session_state.summaries)
         
         st.divider()
-        render_export_options(st.session_state.summaries, uploaded_file.name)
+        # The uploader may be empty (or rejected) by now, so the summaries
+        # keep the name of the file they were generated from
+        render_export_options(st.session_state.summaries, st.session_state.summarized_filename)
     
     # Footer
     st.divider()
@@ -2,8 +2,10 @@
 Configuration management for DocuMind AI
 """
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -20,6 +22,10 @@ class Settings(BaseSettings):
     default_model: str = Field(default="llama-3.3-70b-versatile", env="DEFAULT_MODEL")
     premium_model: str = Field(default="llama-3.3-70b-versatile", env="PREMIUM_MODEL")
     fast_model: str = Field(default="llama-3.1-8b-instant", env="FAST_MODEL")
+    llm_temperature: float = Field(default=0.0, env="LLM_TEMPERATURE")
+    llm_seed: Optional[int] = Field(default=42, env="LLM_SEED")
+    llm_request_timeout: Optional[float] = Field(default=None, env="LLM_REQUEST_TIMEOUT")
+    llm_max_retries: int = Field(default=2, env="LLM_MAX_RETRIES")
     
     # Ollama Configuration
     ollama_base_url: str = Field(default="http://localhost:11434", env="OLLAMA_BASE_URL")
@@ -38,6 +44,7 @@ class Settings(BaseSettings):
     
     # Storage
     storage_type: str = Field(default="local", env="STORAGE_TYPE")
+    persist_uploads: bool = Field(default=False, env="PERSIST_UPLOADS")
     s3_bucket_name: Optional[str] = Field(default=None, env="S3_BUCKET_NAME")
     aws_access_key_id: Optional[str] = Field(default=None, env="AWS_ACCESS_KEY_ID")
     aws_secret_access_key: Optional[str] = Field(default=None, env="AWS_SECRET_ACCESS_KEY")
@@ -50,6 +57,7 @@ class Settings(BaseSettings):
     redis_url: str = Field(default="redis://localhost:6379/0", env="REDIS_URL")
     enable_cache: bool = Field(default=True, env="ENABLE_CACHE")
     cache_ttl_hours: int = Field(default=24, env="CACHE_TTL_HOURS")
+    map_cache_size: int = Field(default=4096, env="MAP_CACHE_SIZE")
     
     # Rate Limiting
     daily_document_limit: int = Field(default=50, env="DAILY_DOCUMENT_LIMIT")
@@ -83,17 +91,33 @@ DATA_DIR = BASE_DIR / "data"
 UPLOAD_DIR = DATA_DIR / "uploads"
 PROCESSED_DIR = DATA_DIR / "processed"
 SUMMARY_DIR = DATA_DIR / "summaries"
+LLM_CACHE_PATH = DATA_DIR / "llm_cache.sqlite"
 
 # Create directories if they don't exist
 for directory in [DATA_DIR, UPLOAD_DIR, PROCESSED_DIR, SUMMARY_DIR]:
     directory.mkdir(parents=True, exist_ok=True)
 
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings from the environment once per process"""
+    return Settings()
+
+
+def _freeze(config: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Recursively wrap a config dict in read-only mapping proxies"""
+    return MappingProxyType({
+        key: _freeze(value) if isinstance(value, dict) else value
+        for key, value in config.items()
+    })
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
 
 
-# Model configurations
-MODEL_CONFIGS = {
+# Model configurations (read-only, shared by every importer)
+MODEL_CONFIGS = _freeze({
     "llama-3.3-70b-versatile": {
         "provider": "groq",
         "context_window": 32768,
@@ -116,11 +140,11 @@ MODEL_CONFIGS = {
         "cost": "free_local",
         "note": "Requires Ollama installed locally"
     }
-}
+})
 
 
 # Strategy selection thresholds
-STRATEGY_THRESHOLDS = {
+STRATEGY_THRESHOLDS = _freeze({
     "stuff": {
         "max_tokens": 4000,
         "description": "Single pass - for short documents"
@@ -134,39 +158,43 @@ STRATEGY_THRESHOLDS = {
         "min_tokens": 4000,
         "description": "Iterative refinement - premium quality"
     }
-}
+})
 
 
-# Summary level configurations
-SUMMARY_LEVELS = {
+# Summary level configurations (top_k: most relevant chunks per level, None = all)
+SUMMARY_LEVELS = _freeze({
     "tldr": {
         "max_length": 150,
         "style": "concise",
-        "description": "1-2 sentence overview"
+        "description": "1-2 sentence overview",
+        "top_k": 10
     },
     "bullet": {
         "max_bullets": 7,
         "style": "structured",
-        "description": "Key points in bullet format"
+        "description": "Key points in bullet format",
+        "top_k": 10
     },
     "executive": {
         "max_length": 500,
         "style": "professional",
-        "description": "Executive overview with context"
+        "description": "Executive overview with context",
+        "top_k": 25
     },
     "detailed": {
         "max_length": 2000,
         "style": "comprehensive",
-        "description": "Detailed analysis with structure"
+        "description": "Detailed analysis with structure",
+        "top_k": None
     }
-}
+})
 
 
 # Summary styles
-SUMMARY_STYLES = {
+SUMMARY_STYLES = _freeze({
     "technical": "Technical and precise language, assumes expert knowledge",
     "simple": "Clear and simple language, suitable for general audience",
     "executive": "Professional business language, focus on key insights",
     "academic": "Scholarly tone, formal language with proper citations",
     "legal": "Formal legal language, precise terminology"
-}
+})
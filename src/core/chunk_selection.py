@@ -0,0 +1,91 @@
+"""
+Relevance-based chunk selection
+Ranks chunks by TF-IDF centrality so shorter summary levels only read the
+most representative parts of a document
+"""
+import math
+import re
+from collections import Counter
+from typing import List, Optional, TypeVar
+
+import numpy as np
+
+from src.core.chunking_engine import TextChunk
+
+T = TypeVar("T")
+
+_TERM_RE = re.compile(r"[a-z][a-z0-9]{2,}")
+
+_STOPWORDS = frozenset("""
+    about above after again against all also and any are because been before
+    being below between both but can could did does doing down during each
+    few for from further had has have having her here hers herself him
+    himself his how into its itself just more most not now off once only
+    other our ours out over own same she should some such than that the
+    their theirs them then there these they this those through too under
+    until very was were what when where which while who whom why will with
+    would you your yours
+""".split())
+
+
+def score_chunks(chunks: List[TextChunk]) -> np.ndarray:
+    """
+    Score each chunk by cosine similarity of its TF-IDF vector to the
+    document centroid - higher means more representative of the whole
+    """
+    term_counts = [
+        Counter(
+            term for term in _TERM_RE.findall(chunk.content.lower())
+            if term not in _STOPWORDS
+        )
+        for chunk in chunks
+    ]
+    
+    # Smoothed inverse document frequency
+    num_chunks = len(chunks)
+    doc_freq = Counter()
+    for counts in term_counts:
+        doc_freq.update(counts.keys())
+    idf = {
+        term: math.log((1 + num_chunks) / (1 + df)) + 1
+        for term, df in doc_freq.items()
+    }
+    
+    # L2-normalised TF-IDF vectors and their centroid
+    vectors = []
+    centroid = Counter()
+    for counts in term_counts:
+        weights = {term: tf * idf[term] for term, tf in counts.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        vector = {term: w / norm for term, w in weights.items()}
+        vectors.append(vector)
+        centroid.update(vector)
+    
+    scores = np.zeros(num_chunks)
+    for i, vector in enumerate(vectors):
+        scores[i] = sum(w * centroid[term] for term, w in vector.items())
+    return scores
+
+
+def select_top_k_chunks(
+    chunks: List[T],
+    k: Optional[int],
+    scores: Optional[np.ndarray] = None
+) -> List[T]:
+    """
+    Keep the k highest-scoring chunks, in document order (ties go to the
+    earlier chunk)
+    
+    k=None (or k >= len(chunks)) keeps every chunk. Pass precomputed scores
+    to rank several levels from a single scoring pass; with scores given,
+    chunks can be any items in the scored order (e.g. LangChain documents
+    built from the TextChunks), otherwise they must be TextChunks.
+    """
+    if k is None or len(chunks) <= k:
+        return chunks
+    
+    if scores is None:
+        scores = score_chunks(chunks)
+    
+    top = np.sort(np.argsort(-scores, kind="stable")[:k])
+    return [chunks[i] for i in top]
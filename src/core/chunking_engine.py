@@ -3,11 +3,51 @@ Intelligent text chunking engine
 Handles dynamic chunk sizing, overlap optimization, and token-aware splitting
 """
 import re
-from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
-import tiktoken
 
 from src.processors.document_processor import ProcessedDocument, DocumentSection
+from src.core.token_counter import ENCODE_THREADS, TokenCounter, TikTokenCounter
+
+# Paragraph breaks (blank lines), sentence boundaries and word starts
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n')
+_SENTENCE_END_RE = re.compile(r'[.!?]\s+')
+_WORD_START_RE = re.compile(r'\s+(?=\S)')
+
+# Prose averages ~4 characters per cl100k token; a section with more than
+# this many characters per chunk token is split without being counted first
+AVG_CHARS_PER_TOKEN = 4
+MIN_CHARS_PER_TOKEN = 3
+MAX_CHARS_PER_TOKEN = 6
+
+# Document token totals at which optimize_chunk_size changes bracket
+CHUNK_SIZE_BRACKETS = (5000, 20000, 50000)
+
+
+def _plan_cut(
+    piece_tokens: List[int],
+    paragraph_end: List[bool],
+    start: int,
+    budget: int
+) -> int:
+    """
+    Pick where the chunk starting at piece `start` ends
+    
+    Takes as many whole pieces as fit in budget tokens (always at least one)
+    and prefers ending on a paragraph break, else on a sentence end. Returns
+    the index one past the chunk's last piece.
+    """
+    end = start
+    total = 0
+    last_paragraph = None
+    while end < len(piece_tokens) and (end == start or total + piece_tokens[end] <= budget):
+        total += piece_tokens[end]
+        if paragraph_end[end]:
+            last_paragraph = end + 1
+        end += 1
+    
+    return last_paragraph if end < len(piece_tokens) and last_paragraph else end
 
 
 @dataclass
@@ -27,6 +67,53 @@ class TextChunk:
             self.metadata = {}
 
 
+class ChunkedDocument(NamedTuple):
+    """Chunks of a document plus aggregate token statistics"""
+    chunks: List[TextChunk]
+    total_tokens: int
+
+
+class _TokenCache:
+    """
+    Token ids and counts of the texts seen while chunking one document
+    
+    Ids are kept per text so each paragraph/sentence/chunk is encoded once
+    (repeated headers, footers and boilerplate included), and bare counts
+    for texts whose ids are never needed (whole sections). A new cache is
+    made for every chunk_document call, so concurrent calls on a shared
+    engine never see (or clear) each other's entries.
+    """
+    
+    def __init__(self, token_counter: TokenCounter):
+        self.token_counter = token_counter
+        self.ids: Dict[str, List[int]] = {}
+        self.counts: Dict[str, int] = {}
+    
+    def encode(self, text: str) -> List[int]:
+        """Encode text, reusing the ids if this exact text was seen before"""
+        tokens = self.ids.get(text)
+        if tokens is None:
+            tokens = self.token_counter.encode(text)
+            self.ids[text] = tokens
+        return tokens
+    
+    def encode_batch(self, texts: List[str]) -> List[List[int]]:
+        """Token ids for each text, encoding all uncached ones in one batch call"""
+        missing = [text for text in dict.fromkeys(texts) if text not in self.ids]
+        if missing:
+            self.ids.update(zip(missing, self.token_counter.encode_batch(missing)))
+        
+        return [self.ids[text] for text in texts]
+    
+    def count_batch(self, texts: List[str]) -> List[int]:
+        """Count tokens for many texts with the token counter"""
+        missing = [text for text in dict.fromkeys(texts) if text not in self.counts]
+        if missing:
+            self.counts.update(zip(missing, self.token_counter.count_batch(missing)))
+        
+        return [self.counts[text] for text in texts]
+
+
 class ChunkingEngine:
     """Intelligent text chunking with multiple strategies"""
     
@@ -34,21 +121,31 @@ class ChunkingEngine:
         self,
         chunk_size: int = 1000,
         chunk_overlap: int = 200,
-        model_name: str = "gpt-3.5-turbo"
+        model_name: str = "gpt-3.5-turbo",
+        token_counter: Optional[TokenCounter] = None
     ):
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
-        self.encoding = tiktoken.encoding_for_model(model_name)
+        
+        # Tokenizer for every count, split and overlap (tiktoken by default)
+        self.token_counter = token_counter or TikTokenCounter(model_name)
+        
+        # The engine holds no per-document state (token caches are made per
+        # chunk_document call), so one instance can serve concurrent sessions
+    
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Count tokens for many texts at once with the token counter"""
+        return self.token_counter.count_batch(texts)
     
     def count_tokens(self, text: str) -> int:
         """Count tokens in text"""
-        return len(self.encoding.encode(text))
+        return self.token_counter.count(text)
     
     def chunk_document(
         self,
         document: ProcessedDocument,
         strategy: str = "smart"
-    ) -> List[TextChunk]:
+    ) -> ChunkedDocument:
         """
         Chunk a document using the specified strategy
         
@@ -57,34 +154,51 @@ class ChunkingEngine:
         - fixed: Fixed-size chunks
         - sentence: Sentence-based chunks
         - section: One chunk per section
+        
+        Returns the chunks together with their total token count
         """
+        cache = _TokenCache(self.token_counter)
         if strategy == "smart":
-            return self._smart_chunk(document)
+            chunks = self._smart_chunk(document, cache)
         elif strategy == "fixed":
-            return self._fixed_chunk(document.full_text)
+            chunks = self._fixed_chunk(document.full_text)
         elif strategy == "sentence":
-            return self._sentence_chunk(document.full_text)
+            chunks = self._sentence_chunk(document.full_text, cache)
         elif strategy == "section":
-            return self._section_chunk(document)
+            chunks = self._section_chunk(document, cache)
         else:
             raise ValueError(f"Unknown chunking strategy: {strategy}")
+        
+        total_tokens = sum(chunk.token_count for chunk in chunks)
+        return ChunkedDocument(chunks=chunks, total_tokens=total_tokens)
     
-    def _smart_chunk(self, document: ProcessedDocument) -> List[TextChunk]:
+    def _smart_chunk(self, document: ProcessedDocument, cache: _TokenCache) -> List[TextChunk]:
         """
         Smart chunking that preserves section boundaries when possible
         Falls back to fixed chunking for long sections
         """
-        chunks = []
-        chunk_id = 0
+        section_chunks: List[Optional[List[TextChunk]]] = [None] * len(document.sections)
+        long_sections = []
+        
+        # Skip tokenizing sections that are clearly too long to fit
+        max_chars = self.chunk_size * MAX_CHARS_PER_TOKEN
+        candidates = [
+            section.content for section in document.sections
+            if len(section.content) <= max_chars
+        ]
+        section_counts = iter(cache.count_batch(candidates))
         
-        for section in document.sections:
-            section_tokens = self.count_tokens(section.content)
+        for index, section in enumerate(document.sections):
+            if len(section.content) > max_chars:
+                section_tokens = None
+            else:
+                section_tokens = next(section_counts)
             
             # If section fits in one chunk, use it as-is
-            if section_tokens <= self.chunk_size:
-                chunks.append(TextChunk(
+            if section_tokens is not None and section_tokens <= self.chunk_size:
+                section_chunks[index] = [TextChunk(
                     content=section.content,
-                    chunk_id=chunk_id,
+                    chunk_id=0,
                     section_title=section.title,
                     section_level=section.level,
                     token_count=section_tokens,
@@ -92,200 +206,241 @@ class ChunkingEngine:
                         'strategy': 'section_preserved',
                         'is_complete_section': True
                     }
-                ))
-                chunk_id += 1
+                )]
             else:
-                # Split long section into multiple chunks
-                section_chunks = self._split_long_section(
-                    section,
-                    start_chunk_id=chunk_id
-                )
-                chunks.extend(section_chunks)
-                chunk_id += len(section_chunks)
+                long_sections.append(index)
+        
+        # Split long sections independently; tiktoken releases the GIL while
+        # encoding, so on multi-core hosts they are split in parallel
+        def split(index: int) -> List[TextChunk]:
+            return self._split_long_section(document.sections[index], 0, cache)
+        
+        if ENCODE_THREADS > 1 and len(long_sections) > 1:
+            with ThreadPoolExecutor(max_workers=ENCODE_THREADS) as executor:
+                for index, chunks in zip(long_sections, executor.map(split, long_sections)):
+                    section_chunks[index] = chunks
+        else:
+            for index in long_sections:
+                section_chunks[index] = split(index)
+        
+        # Number chunks in document order
+        chunks = [chunk for group in section_chunks for chunk in group]
+        for chunk_id, chunk in enumerate(chunks):
+            chunk.chunk_id = chunk_id
         
         return chunks
     
-    def _split_long_section(
-        self,
-        section: DocumentSection,
-        start_chunk_id: int
-    ) -> List[TextChunk]:
-        """Split a long section into multiple chunks while preserving context"""
-        chunks = []
+    def _sentence_spans(self, text: str, start: int, end: int) -> List[Tuple[int, int]]:
+        """
+        Split text[start:end] into sentence spans
         
-        # Try to split by paragraphs first
-        paragraphs = self._split_into_paragraphs(section.content)
+        Cuts sit right after a sentence terminator plus any newlines that
+        follow it - where tiktoken's pre-tokenizer splits too, so the spans
+        encoded one by one add up to the ids of the whole range
+        """
+        bounds = [start]
+        for match in _SENTENCE_END_RE.finditer(text, start, end):
+            position = match.start() + 1
+            while position < end and text[position] in '\r\n':
+                position += 1
+            if position < end:
+                bounds.append(position)
+        bounds.append(end)
+        return list(zip(bounds, bounds[1:]))
+    
+    def _word_spans(self, text: str, start: int, end: int) -> List[Tuple[int, int]]:
+        """
+        Split text[start:end] into word spans, each word with the whitespace
+        before it (tiktoken's pre-tokenizer also keeps a space with the word
+        after it, and newlines with the punctuation before them)
+        """
+        bounds = [start]
+        for match in _WORD_START_RE.finditer(text, start, end):
+            position = self._word_bound(text, match.start())
+            if start < position < match.end():
+                bounds.append(position)
+        bounds.append(end)
+        return list(zip(bounds, bounds[1:]))
+    
+    @staticmethod
+    def _word_bound(text: str, position: int) -> int:
+        """Where a word span starts, given the whitespace run before the word"""
+        if position > 0 and not text[position - 1].isalnum():
+            while text[position] in '\r\n':
+                position += 1
+        return position
+    
+    def _overlap(self, raw: str, tail_ids: List[int]) -> Tuple[str, List[int]]:
+        """
+        Overlap text and token ids from the last tokens of a chunk's raw text
         
-        current_chunk = []
-        current_tokens = 0
-        chunk_id = start_chunk_id
+        A word cut by the first token is dropped, so the next chunk starts on
+        a word boundary. The kept tokens are then those of the kept text, as
+        word bounds are where the tokenizer splits too; the text is encoded
+        again only when the dropped tokens do not decode to the dropped text.
+        """
+        if not tail_ids:
+            return "", []
         
-        for para in paragraphs:
-            para_tokens = self.count_tokens(para)
-            
-            # If single paragraph is too large, split it
-            if para_tokens > self.chunk_size:
-                # Save current chunk if any
-                if current_chunk:
-                    chunks.append(self._create_chunk_from_paragraphs(
-                        current_chunk,
-                        chunk_id,
-                        section.title,
-                        section.level
-                    ))
-                    chunk_id += 1
-                    current_chunk = []
-                    current_tokens = 0
-                
-                # Split large paragraph by sentences
-                para_chunks = self._split_large_paragraph(para, chunk_id, section)
-                chunks.extend(para_chunks)
-                chunk_id += len(para_chunks)
-            
-            # If adding paragraph exceeds chunk size, save current chunk
-            elif current_tokens + para_tokens > self.chunk_size:
-                if current_chunk:
-                    chunks.append(self._create_chunk_from_paragraphs(
-                        current_chunk,
-                        chunk_id,
-                        section.title,
-                        section.level
-                    ))
-                    chunk_id += 1
-                
-                # Start new chunk with overlap from previous
-                if chunks and self.chunk_overlap > 0:
-                    overlap_text = self._get_overlap_text(chunks[-1].content)
-                    current_chunk = [overlap_text, para]
-                    current_tokens = self.count_tokens(overlap_text) + para_tokens
-                else:
-                    current_chunk = [para]
-                    current_tokens = para_tokens
-            
-            else:
-                current_chunk.append(para)
-                current_tokens += para_tokens
+        overlap_text = self.token_counter.decode(tail_ids)
+        if not raw.endswith(overlap_text):
+            # The tokenizer's decode does not reproduce the text (e.g. WordPiece)
+            return overlap_text, tail_ids
         
-        # Save last chunk
-        if current_chunk:
-            chunks.append(self._create_chunk_from_paragraphs(
-                current_chunk,
-                chunk_id,
-                section.title,
-                section.level
-            ))
+        before = len(raw) - len(overlap_text) - 1
+        if before < 0 or raw[before].isspace() or overlap_text[:1].isspace():
+            return overlap_text, tail_ids
         
-        return chunks
+        match = _WORD_START_RE.search(overlap_text)
+        if not match:
+            return "", []
+        bound = self._word_bound(overlap_text, match.start())
+        
+        dropped, count = "", 0
+        while len(dropped) < bound and count < len(tail_ids):
+            count += 1
+            dropped = self.token_counter.decode(tail_ids[:count])
+        
+        if dropped == overlap_text[:bound]:
+            return overlap_text[bound:], tail_ids[count:]
+        return overlap_text[bound:], self.token_counter.encode(overlap_text[bound:])
     
-    def _split_large_paragraph(
+    def _split_long_section(
         self,
-        paragraph: str,
+        section: DocumentSection,
         start_chunk_id: int,
-        section: DocumentSection
+        cache: _TokenCache
     ) -> List[TextChunk]:
-        """Split a very large paragraph by sentences"""
-        sentences = self._split_into_sentences(paragraph)
-        chunks = []
+        """
+        Split a long section into multiple chunks while preserving context
         
-        current_chunk = []
-        current_tokens = 0
+        Single pass over token-counted pieces of the section: paragraphs are
+        packed greedily up to chunk_size tokens, a paragraph too large for a
+        chunk is broken into sentence pieces in place, and a sentence longer
+        than chunk_size into word pieces. Every piece is encoded once and
+        chunks are slices of the section text; each chunk after the first
+        starts with the previous chunk's last chunk_overlap tokens, shortened
+        where the next piece would not fit after it. No chunk exceeds
+        chunk_size tokens unless a single word does.
+        """
+        text = section.content
+        
+        # Paragraph pieces, cut after the last newline of each blank-line run
+        bounds = [0, *(match.end() for match in _PARAGRAPH_BREAK_RE.finditer(text)), len(text)]
+        spans = [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+        piece_ids = cache.encode_batch([text[a:b] for a, b in spans])
+        piece_tokens = [len(ids) for ids in piece_ids]
+        paragraph_end = [True] * len(spans)  # piece ends a paragraph
+        # How a piece can still be split: 2 = paragraph (into sentences),
+        # 1 = sentence (into words), 0 = word (not at all)
+        split_level = [2] * len(spans)
+        
+        def split_piece(index: int):
+            """Replace piece index with its sentence or word pieces"""
+            if split_level[index] == 2:
+                sub_spans = self._sentence_spans(text, *spans[index])
+            else:
+                sub_spans = self._word_spans(text, *spans[index])
+            count = len(sub_spans)
+            
+            spans[index:index + 1] = sub_spans
+            piece_ids[index:index + 1] = cache.encode_batch([text[a:b] for a, b in sub_spans])
+            piece_tokens[index:index + 1] = [len(ids) for ids in piece_ids[index:index + count]]
+            paragraph_end[index:index + 1] = [False] * (count - 1) + [paragraph_end[index]]
+            split_level[index:index + 1] = [split_level[index] - 1] * count
+        
+        chunks = []
         chunk_id = start_chunk_id
+        overlap_text = ""
+        overlap_ids: List[int] = []
+        start = 0
         
-        for sentence in sentences:
-            sent_tokens = self.count_tokens(sentence)
+        while start < len(spans):
+            budget = self.chunk_size - len(overlap_ids)
+            
+            # Break an oversized paragraph into sentences, and a sentence
+            # longer than a whole chunk into words, before packing it
+            while (
+                split_level[start] == 2 and piece_tokens[start] > budget
+                or split_level[start] == 1 and piece_tokens[start] > self.chunk_size
+            ):
+                split_piece(start)
+            
+            # Shorten the overlap when the next piece would not fit after it
+            if piece_tokens[start] > budget:
+                keep = max(self.chunk_size - piece_tokens[start], 0)
+                kept_ids = overlap_ids[len(overlap_ids) - keep:] if keep else []
+                overlap_text, overlap_ids = self._overlap(overlap_text, kept_ids)
+                budget = self.chunk_size - len(overlap_ids)
+            
+            cut = _plan_cut(piece_tokens, paragraph_end, start, budget)
+            
+            # Stripping a chunk can change how its first and last words are
+            # tokenized, so the content is counted as it is stored; a chunk that
+            # ends up over chunk_size gives back its last piece (or its overlap)
+            while True:
+                raw = overlap_text + text[spans[start][0]:spans[cut - 1][1]]
+                content = raw.strip()
+                token_count = self.token_counter.count(content)
+                
+                if token_count <= self.chunk_size:
+                    break
+                if cut > start + 1:
+                    cut -= 1
+                elif overlap_ids:
+                    overlap_text, overlap_ids = "", []
+                else:
+                    break
             
-            if current_tokens + sent_tokens > self.chunk_size and current_chunk:
-                # Save current chunk
-                chunk_text = ' '.join(current_chunk)
+            if content:
+                whole_paragraphs = paragraph_end[cut - 1] and (start == 0 or paragraph_end[start - 1])
                 chunks.append(TextChunk(
-                    content=chunk_text,
+                    content=content,
                     chunk_id=chunk_id,
                     section_title=section.title,
                     section_level=section.level,
-                    token_count=self.count_tokens(chunk_text),
-                    metadata={'strategy': 'sentence_split'}
+                    token_count=token_count,
+                    metadata={
+                        'strategy': 'paragraph_based' if whole_paragraphs else 'sentence_split'
+                    }
                 ))
                 chunk_id += 1
-                
-                # Start new chunk with overlap
-                if self.chunk_overlap > 0:
-                    overlap_text = self._get_overlap_text(chunk_text)
-                    current_chunk = [overlap_text, sentence]
-                    current_tokens = self.count_tokens(overlap_text) + sent_tokens
-                else:
-                    current_chunk = [sentence]
-                    current_tokens = sent_tokens
-            else:
-                current_chunk.append(sentence)
-                current_tokens += sent_tokens
-        
-        # Save last chunk
-        if current_chunk:
-            chunk_text = ' '.join(current_chunk)
-            chunks.append(TextChunk(
-                content=chunk_text,
-                chunk_id=chunk_id,
-                section_title=section.title,
-                section_level=section.level,
-                token_count=self.count_tokens(chunk_text),
-                metadata={'strategy': 'sentence_split'}
-            ))
+            
+            if self.chunk_overlap > 0:
+                token_ids = list(overlap_ids)
+                for ids in piece_ids[start:cut]:
+                    token_ids += ids
+                overlap_text, overlap_ids = self._overlap(raw, token_ids[-self.chunk_overlap:])
+            start = cut
         
         return chunks
     
-    def _create_chunk_from_paragraphs(
-        self,
-        paragraphs: List[str],
-        chunk_id: int,
-        section_title: str,
-        section_level: int
-    ) -> TextChunk:
-        """Create a chunk from a list of paragraphs"""
-        content = '\n\n'.join(paragraphs)
-        return TextChunk(
-            content=content,
-            chunk_id=chunk_id,
-            section_title=section_title,
-            section_level=section_level,
-            token_count=self.count_tokens(content),
-            metadata={'strategy': 'paragraph_based'}
-        )
-    
-    def _get_overlap_text(self, text: str) -> str:
-        """Get overlap text from the end of previous chunk"""
-        tokens = self.encoding.encode(text)
-        
-        if len(tokens) <= self.chunk_overlap:
-            return text
-        
-        # Get last N tokens for overlap
-        overlap_tokens = tokens[-self.chunk_overlap:]
-        return self.encoding.decode(overlap_tokens)
-    
-    def _split_into_paragraphs(self, text: str) -> List[str]:
-        """Split text into paragraphs"""
-        # Split by double newlines or more
-        paragraphs = re.split(r'\n\s*\n', text)
-        return [p.strip() for p in paragraphs if p.strip()]
-    
     def _split_into_sentences(self, text: str) -> List[str]:
         """Split text into sentences"""
-        # Simple sentence splitter (can be improved with nltk)
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        # Simple sentence splitter (can be improved with nltk): cut after
+        # each terminator that is followed by whitespace
+        sentences = []
+        start = 0
+        for match in _SENTENCE_END_RE.finditer(text):
+            sentences.append(text[start:match.start() + 1])
+            start = match.end()
+        sentences.append(text[start:])
+        return [s for s in map(str.strip, sentences) if s]
     
     def _fixed_chunk(self, text: str) -> List[TextChunk]:
         """Create fixed-size chunks"""
         chunks = []
-        tokens = self.encoding.encode(text)
+        tokens = self.token_counter.encode(text)
         
-        chunk_id = 0
-        i = 0
+        # Chunks start every chunk_size - chunk_overlap tokens (back to back
+        # when there is no overlap)
+        step = self.chunk_size - self.chunk_overlap
         
-        while i < len(tokens):
-            # Get chunk tokens
+        for chunk_id, i in enumerate(range(0, len(tokens), step)):
+            # Get chunk tokens (decoding per chunk in tiktoken's Rust core is
+            # much cheaper than building per-token offsets in Python)
             chunk_tokens = tokens[i:i + self.chunk_size]
-            chunk_text = self.encoding.decode(chunk_tokens)
+            chunk_text = self.token_counter.decode(chunk_tokens)
             
             chunks.append(TextChunk(
                 content=chunk_text,
@@ -293,63 +448,69 @@ class ChunkingEngine:
                 token_count=len(chunk_tokens),
                 metadata={'strategy': 'fixed'}
             ))
-            
-            # Move forward with overlap
-            i += self.chunk_size - self.chunk_overlap
-            chunk_id += 1
         
         return chunks
     
-    def _sentence_chunk(self, text: str) -> List[TextChunk]:
+    def _sentence_chunk(self, text: str, cache: _TokenCache) -> List[TextChunk]:
         """Create chunks based on sentences"""
         sentences = self._split_into_sentences(text)
+        
+        # Sentences are joined with ' ', so every sentence after a chunk's
+        # first is encoded with its leading space; the ids then add up to
+        # exactly the ids of the joined chunk text
+        spaced = cache.encode_batch([' ' + sentence for sentence in sentences])
         chunks = []
         
         current_chunk = []
-        current_tokens = 0
+        current_ids = []
         chunk_id = 0
         
-        for sentence in sentences:
-            sent_tokens = self.count_tokens(sentence)
+        for sentence, spaced_ids in zip(sentences, spaced):
             
-            if current_tokens + sent_tokens > self.chunk_size and current_chunk:
-                chunk_text = ' '.join(current_chunk)
+            if len(current_ids) + len(spaced_ids) > self.chunk_size and current_chunk:
                 chunks.append(TextChunk(
-                    content=chunk_text,
+                    content=' '.join(current_chunk),
                     chunk_id=chunk_id,
-                    token_count=self.count_tokens(chunk_text),
+                    token_count=len(current_ids),
                     metadata={'strategy': 'sentence'}
                 ))
                 chunk_id += 1
                 current_chunk = [sentence]
-                current_tokens = sent_tokens
-            else:
+                current_ids = list(cache.encode(sentence))
+            elif current_chunk:
                 current_chunk.append(sentence)
-                current_tokens += sent_tokens
+                current_ids += spaced_ids
+            else:
+                current_chunk = [sentence]
+                current_ids = list(cache.encode(sentence))
         
         # Save last chunk
         if current_chunk:
-            chunk_text = ' '.join(current_chunk)
             chunks.append(TextChunk(
-                content=chunk_text,
+                content=' '.join(current_chunk),
                 chunk_id=chunk_id,
-                token_count=self.count_tokens(chunk_text),
+                token_count=len(current_ids),
                 metadata={'strategy': 'sentence'}
             ))
         
         return chunks
     
-    def _section_chunk(self, document: ProcessedDocument) -> List[TextChunk]:
+    def _section_chunk(self, document: ProcessedDocument, cache: _TokenCache) -> List[TextChunk]:
         """Create one chunk per section"""
         chunks = []
+        section_counts = cache.count_batch(
+            [section.content for section in document.sections]
+        )
         
-        for chunk_id, section in enumerate(document.sections):
+        for chunk_id, (section, section_tokens) in enumerate(
+            zip(document.sections, section_counts)
+        ):
             chunks.append(TextChunk(
                 content=section.content,
                 chunk_id=chunk_id,
                 section_title=section.title,
                 section_level=section.level,
-                token_count=self.count_tokens(section.content),
+                token_count=section_tokens,
                 metadata={
                     'strategy': 'section',
                     'is_complete_section': True
@@ -358,11 +519,27 @@ class ChunkingEngine:
         
         return chunks
     
+    def _estimate_total_tokens(self, document: ProcessedDocument) -> int:
+        """
+        Token total of the document, precise enough to pick a chunk size bracket
+        """
+        num_chars = len(document.full_text)
+        low = num_chars // MAX_CHARS_PER_TOKEN
+        high = num_chars // MIN_CHARS_PER_TOKEN
+        if not any(low <= boundary <= high for boundary in CHUNK_SIZE_BRACKETS):
+            return num_chars // AVG_CHARS_PER_TOKEN
+        
+        return self.token_counter.count(document.full_text)
+    
     def optimize_chunk_size(self, document: ProcessedDocument) -> int:
         """
         Dynamically determine optimal chunk size based on document characteristics
+        
+        Only picks a size bracket, so the token total is estimated from the
+        character count. The document is tokenized only when a bracket
+        boundary falls within the plausible token range.
         """
-        total_tokens = self.count_tokens(document.full_text)
+        total_tokens = self._estimate_total_tokens(document)
         num_sections = len(document.sections)
         
         # For short documents, use smaller chunks
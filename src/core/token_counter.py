@@ -0,0 +1,107 @@
+"""
+Token counters used by the chunking engine
+tiktoken is the default; a HuggingFace `tokenizers` backend is available for
+deployments that want to count with a model's own vocabulary
+"""
+import os
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from pathlib import Path
+from typing import List
+
+import tiktoken
+
+# Threads used for batch encoding
+ENCODE_THREADS = min(os.cpu_count() or 1, 8)
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model_name: str) -> tiktoken.Encoding:
+    """tiktoken encoding for a model, shared by all engines and counters"""
+    return tiktoken.encoding_for_model(model_name)
+
+
+class TokenCounter(ABC):
+    """
+    Base class for token counters
+    
+    The chunking engine splits on token ids and decodes chunk overlaps, so
+    a counter encodes and decodes too; every count in a chunked document
+    then comes from the same tokenizer
+    """
+    
+    @abstractmethod
+    def encode(self, text: str) -> List[int]:
+        """Token ids of text (no special tokens)"""
+        pass
+    
+    @abstractmethod
+    def decode(self, tokens: List[int]) -> str:
+        """Text of token ids"""
+        pass
+    
+    def encode_batch(self, texts: List[str]) -> List[List[int]]:
+        """Token ids for many texts"""
+        return [self.encode(text) for text in texts]
+    
+    def count(self, text: str) -> int:
+        """Count tokens in text"""
+        return len(self.encode(text))
+    
+    def count_batch(self, texts: List[str]) -> List[int]:
+        """Count tokens for many texts"""
+        return [len(tokens) for tokens in self.encode_batch(texts)]
+
+
+class TikTokenCounter(TokenCounter):
+    """Counts tokens with a tiktoken encoding (default)"""
+    
+    def __init__(self, model_name: str = "gpt-3.5-turbo"):
+        self.encoding = get_encoding(model_name)
+    
+    def encode(self, text: str) -> List[int]:
+        return self.encoding.encode_ordinary(text)
+    
+    def decode(self, tokens: List[int]) -> str:
+        return self.encoding.decode(tokens)
+    
+    def encode_batch(self, texts: List[str]) -> List[List[int]]:
+        # tiktoken's thread pool only pays off with more than one core
+        if ENCODE_THREADS == 1 or len(texts) < 2:
+            return super().encode_batch(texts)
+        
+        return self.encoding.encode_ordinary_batch(texts, num_threads=ENCODE_THREADS)
+
+
+class HFTokenizerCounter(TokenCounter):
+    """
+    Counts tokens with a HuggingFace fast tokenizer
+    
+    tokenizer may be a local tokenizer.json path or a Hub model name
+    (e.g. "gpt2"). Counts follow that tokenizer's vocabulary, which can
+    differ from tiktoken's.
+    """
+    
+    def __init__(self, tokenizer: str = "gpt2"):
+        try:
+            from tokenizers import Tokenizer
+        except ImportError:
+            raise ImportError(
+                "HFTokenizerCounter requires the tokenizers package. "
+                "Install it with `pip install tokenizers`."
+            )
+        
+        if Path(tokenizer).is_file():
+            self.tokenizer = Tokenizer.from_file(tokenizer)
+        else:
+            self.tokenizer = Tokenizer.from_pretrained(tokenizer)
+    
+    def encode(self, text: str) -> List[int]:
+        return self.tokenizer.encode(text, add_special_tokens=False).ids
+    
+    def decode(self, tokens: List[int]) -> str:
+        return self.tokenizer.decode(tokens)
+    
+    def encode_batch(self, texts: List[str]) -> List[List[int]]:
+        encoded = self.tokenizer.encode_batch(texts, add_special_tokens=False)
+        return [encoding.ids for encoding in encoded]
@@ -0,0 +1,110 @@
+"""
+LLM Response Cache - Persists model responses across runs
+Repeated prompts (same document, style and model) are served from SQLite
+instead of issuing another API call
+"""
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import Column, DateTime, Integer, String, create_engine, func, select
+from sqlalchemy.orm import Session, declarative_base
+from langchain.cache import SQLAlchemyCache
+from langchain.globals import get_llm_cache, set_llm_cache
+from langchain_core.load import dumps, loads
+
+from config.settings import settings, LLM_CACHE_PATH
+
+
+Base = declarative_base()
+
+
+class TimestampedLLMCache(Base):
+    """SQLite table for cached LLM generations with insertion time"""
+    
+    __tablename__ = "llm_cache"
+    prompt = Column(String, primary_key=True)
+    llm = Column(String, primary_key=True)
+    idx = Column(Integer, primary_key=True)
+    response = Column(String)
+    created_at = Column(DateTime, server_default=func.now())
+
+
+class TTLSQLiteCache(SQLAlchemyCache):
+    """
+    SQLite-backed LLM cache with time-based expiry
+    
+    Entries are keyed by the exact prompt and the serialized model
+    parameters (model name, temperature, ...), so a hit requires the same
+    chunk text, summary type, style and model. Entries older than the TTL
+    are never served; they are deleted on startup and overwritten on update.
+    """
+    
+    def __init__(self, database_path: Path, ttl_hours: int):
+        engine = create_engine(f"sqlite:///{database_path}")
+        super().__init__(engine, TimestampedLLMCache)
+        self.ttl = timedelta(hours=ttl_hours)
+        self.prune_expired()
+    
+    def _cutoff(self) -> datetime:
+        """Oldest creation time still within the TTL"""
+        # SQLite's CURRENT_TIMESTAMP is UTC
+        return datetime.utcnow() - self.ttl
+    
+    def lookup(self, prompt: str, llm_string: str):
+        """Look up an unexpired generation for the prompt and model parameters"""
+        stmt = (
+            select(self.cache_schema.response)
+            .where(self.cache_schema.prompt == prompt)
+            .where(self.cache_schema.llm == llm_string)
+            .where(self.cache_schema.created_at >= self._cutoff())
+            .order_by(self.cache_schema.idx)
+        )
+        with Session(self.engine) as session:
+            rows = session.execute(stmt).fetchall()
+        
+        if not rows:
+            return None
+        return [loads(row[0]) for row in rows]
+    
+    def update(self, prompt: str, llm_string: str, return_val) -> None:
+        """Store generations, restarting the TTL of an existing (expired) entry"""
+        now = datetime.utcnow()
+        with Session(self.engine) as session, session.begin():
+            for idx, generation in enumerate(return_val):
+                session.merge(self.cache_schema(
+                    prompt=prompt,
+                    llm=llm_string,
+                    idx=idx,
+                    response=dumps(generation),
+                    created_at=now
+                ))
+    
+    def prune_expired(self) -> int:
+        """Delete entries older than the TTL, returns the number removed"""
+        with Session(self.engine) as session, session.begin():
+            return session.query(self.cache_schema).filter(
+                self.cache_schema.created_at < self._cutoff()
+            ).delete()
+
+
+def configure_llm_cache(database_path: Optional[Path] = None) -> Optional[TTLSQLiteCache]:
+    """
+    Install the persistent LLM cache globally for all LangChain models
+    
+    Safe to call on every Streamlit rerun: the cache is only created once.
+    Returns None when caching is disabled in settings.
+    """
+    if not settings.enable_cache:
+        return None
+    
+    current = get_llm_cache()
+    if isinstance(current, TTLSQLiteCache):
+        return current
+    
+    cache = TTLSQLiteCache(
+        database_path or LLM_CACHE_PATH,
+        ttl_hours=settings.cache_ttl_hours
+    )
+    set_llm_cache(cache)
+    return cache
@@ -2,7 +2,10 @@
 LLM Manager - Handles model initialization and routing
 Supports Groq (Gemma-2, LLaMA-3) and Ollama (local models)
 """
-from typing import Optional, Dict, Any
+import threading
+from typing import Optional, Dict, Any, Tuple
+import groq
+import httpx
 from langchain_groq import ChatGroq
 from langchain_community.llms import Ollama
 from langchain.callbacks import StreamingStdOutCallbackHandler
@@ -15,12 +18,14 @@ class LLMManager:
     
     def __init__(self):
         self.groq_api_key = settings.groq_api_key
-        self.models_cache = {}
+        self.models_cache: Dict[Tuple[str, float, bool], Any] = {}
+        self._groq_clients = None
+        self._init_lock = threading.Lock()
     
     def get_model(
         self,
         model_name: Optional[str] = None,
-        temperature: float = 0.1,
+        temperature: Optional[float] = None,
         streaming: bool = False
     ):
         """
@@ -28,7 +33,7 @@ class LLMManager:
         
         Args:
             model_name: Name of the model (uses default if None)
-            temperature: Model temperature (0.0 - 1.0)
+            temperature: Model temperature (0.0 - 1.0, settings.llm_temperature if None)
             streaming: Enable streaming output
         
         Returns:
@@ -36,29 +41,67 @@ class LLMManager:
         """
         if model_name is None:
             model_name = settings.default_model
+        if temperature is None:
+            temperature = settings.llm_temperature
         
-        # Check cache
-        cache_key = f"{model_name}_{temperature}_{streaming}"
-        if cache_key in self.models_cache:
-            return self.models_cache[cache_key]
+        # Check cache (lock-free on hits)
+        cache_key = (model_name, temperature, streaming)
+        model = self.models_cache.get(cache_key)
+        if model is not None:
+            return model
         
         # Get model config
         config = MODEL_CONFIGS.get(model_name)
         if not config:
             raise ValueError(f"Unknown model: {model_name}")
         
-        # Initialize based on provider
-        if config['provider'] == 'groq':
-            model = self._get_groq_model(model_name, temperature, streaming)
-        elif config['provider'] == 'ollama':
-            model = self._get_ollama_model(model_name, temperature, streaming)
-        else:
-            raise ValueError(f"Unknown provider: {config['provider']}")
-        
-        # Cache the model
-        self.models_cache[cache_key] = model
+        with self._init_lock:
+            # Another thread may have built it while we waited
+            model = self.models_cache.get(cache_key)
+            if model is not None:
+                return model
+            
+            # Initialize based on provider
+            if config['provider'] == 'groq':
+                model = self._get_groq_model(model_name, temperature, streaming)
+            elif config['provider'] == 'ollama':
+                model = self._get_ollama_model(model_name, temperature, streaming)
+            else:
+                raise ValueError(f"Unknown provider: {config['provider']}")
+            
+            # Cache the model
+            self.models_cache[cache_key] = model
         return model
     
+    def _get_groq_clients(self) -> Tuple[Any, Any]:
+        """
+        Get the (sync, async) Groq completion clients shared by all Groq models
+        
+        Both sit on pooled HTTP/2 connections, so the many small requests of
+        a map-reduce run reuse connections instead of opening new ones. The
+        timeout and retries are set here, as ChatGroq only applies its own to
+        clients it builds itself.
+        """
+        if self._groq_clients is None:
+            limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+            sync_client = groq.Groq(
+                api_key=self.groq_api_key,
+                timeout=settings.llm_request_timeout,
+                max_retries=settings.llm_max_retries,
+                http_client=httpx.Client(http2=True, limits=limits)
+            )
+            async_client = groq.AsyncGroq(
+                api_key=self.groq_api_key,
+                timeout=settings.llm_request_timeout,
+                max_retries=settings.llm_max_retries,
+                http_client=httpx.AsyncClient(http2=True, limits=limits)
+            )
+            self._groq_clients = (
+                sync_client.chat.completions,
+                async_client.chat.completions
+            )
+        return self._groq_clients
+    
     def _get_groq_model(
         self,
         model_name: str,
@@ -67,14 +110,21 @@ class LLMManager:
     ) -> ChatGroq:
         """Initialize a Groq model"""
         callbacks = [StreamingStdOutCallbackHandler()] if streaming else None
+        client, async_client = self._get_groq_clients()
         
         return ChatGroq(
+            client=client,
+            async_client=async_client,
             groq_api_key=self.groq_api_key,
             model_name=model_name,
             temperature=temperature,
             streaming=streaming,
             callbacks=callbacks,
-            max_tokens=None  # Let model decide
+            max_tokens=None,  # Let model decide
+            request_timeout=settings.llm_request_timeout,
+            max_retries=settings.llm_max_retries,
+            # Fixed seed keeps repeated prompts reproducible
+            model_kwargs={} if settings.llm_seed is None else {"seed": settings.llm_seed}
         )
     
     def _get_ollama_model(
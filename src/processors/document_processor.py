@@ -2,19 +2,122 @@
 Document processors for various file formats
 Handles PDF, DOCX, TXT, and Markdown files
 """
+import io
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Type, Union
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
-import PyPDF2
-import pdfplumber
-from docx import Document
-from bs4 import BeautifulSoup
+import numpy as np
 
+from config.settings import settings
 
-@dataclass
+# Parsing backends (pdfplumber, pypdfium2, PyPDF2, python-docx) are imported
+# where they are used, so text-only pipelines never load them
+
+# Heading lines, one alternative per heading format (tried in this order).
+# Each matches a whole line, ignoring surrounding whitespace ([^\S\n] is
+# whitespace that stays on the line). Matches start at the newline before
+# the heading, so the regex engine can jump from newline to newline, and a
+# first-character check skips lines no heading format can start with.
+_HEADING_RE = re.compile(r"""
+    \n[^\S\n]*
+    (?=[\#A-Z\d])
+    (?:
+        (?P<md>\#{1,6})[^\S\n]+(?P<md_title>\S(?:.*\S)?)        # Markdown headers
+      | (?P<caps>[A-Z](?:[A-Z]|[^\S\n]){2,}[A-Z])               # ALL CAPS headers
+      | (?P<num>\d+\.(?:\d+\.)*)[^\S\n]+(?P<num_title>\S(?:.*\S)?)  # 1. 1.1. headers
+      | (?P<roman>[IVXLCDM]+\.[^\S\n]+\S(?:.*\S)?)              # Roman numerals
+    )
+    [^\S\n]*(?=\n|\Z)
+""", re.VERBOSE)
+
+# Newline plus a whitespace-only line after it, dropped from section content
+_BLANK_LINE_RE = re.compile(r'\n[^\S\n]*(?=\n)')
+
+# Whitespace bytes, indexed by byte value (ASCII only: bytes from 0x80 are
+# parts of multibyte UTF-8 characters), and the whitespace characters outside
+# ASCII with their UTF-8 bytes - together exactly the separators str.split uses
+_IS_SPACE_BYTE = np.array([chr(c).isspace() for c in range(256)]) & (np.arange(256) < 128)
+_MULTIBYTE_SPACES = [
+    (chr(c), np.frombuffer(chr(c).encode('utf-8'), dtype=np.uint8))
+    for c in range(128, 0x3001) if chr(c).isspace()
+]
+
+
+def _count_words(text: str) -> int:
+    """
+    Number of whitespace-separated words, the same as len(text.split())
+    
+    A word starts wherever a non-space character follows a space (or the
+    start), so this is a vectorised transition count over the UTF-8 bytes
+    with no per-word objects. Bytes of a multibyte character count as one
+    run, and the few multibyte whitespace characters are marked as spaces
+    only when the text contains them.
+    """
+    data = np.frombuffer(text.encode('utf-8'), dtype=np.uint8)
+    if not data.size:
+        return 0
+    in_word = ~_IS_SPACE_BYTE[data]
+    
+    if not text.isascii():
+        for char, encoded in _MULTIBYTE_SPACES:
+            if char not in text:
+                continue
+            # UTF-8 is self-synchronising: a byte match is a character match
+            size = data.size - encoded.size + 1
+            starts = data[:size] == encoded[0]
+            for offset in range(1, encoded.size):
+                starts &= data[offset:offset + size] == encoded[offset]
+            for offset in range(encoded.size):
+                in_word[offset:offset + size][starts] = False
+    
+    return int(in_word[0]) + int(np.count_nonzero(in_word[1:] > in_word[:-1]))
+
+
+# Worker processes for PDF page extraction, used from this many pages on
+# (below that, starting workers and reopening the PDF costs more than it saves)
+PDF_WORKERS = min(os.cpu_count() or 1, 8)
+PDF_PARALLEL_MIN_PAGES = 8
+
+# Worker processes for DocumentProcessorFactory.process_many (one file per task)
+DOCUMENT_WORKERS = min(os.cpu_count() or 1, 8)
+
+# Workers start from a clean forkserver process (spawn where there is none):
+# forking a process that runs threads (Streamlit, tokenizers) can deadlock
+_WORKER_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def _extract_pdf_pages(
+    source: Union[str, Path, bytes],
+    start: int,
+    stop: int
+) -> List[Tuple[Optional[str], List]]:
+    """Text and tables of pages [start, stop) of a PDF (runs in a worker process)"""
+    import pdfplumber
+    
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    with pdfplumber.open(source) as pdf:
+        return [(page.extract_text(), page.extract_tables()) for page in pdf.pages[start:stop]]
+
+
+def _serial_page_extraction():
+    """
+    process_many worker initializer: the workers already use every core, so
+    PDF pages are extracted in the worker itself instead of a nested pool
+    """
+    global PDF_WORKERS
+    PDF_WORKERS = 1
+
+
+@dataclass(slots=True, frozen=True)
 class DocumentSection:
     """Represents a section in a document"""
     title: str
@@ -25,9 +128,15 @@ class DocumentSection:
     end_position: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedDocument:
-    """Structured representation of a processed document"""
+    """
+    Structured representation of a processed document
+    
+    total_words counts whitespace-separated words, len(full_text.split()):
+    punctuation between spaces is a word of its own ("a — b" is 3 words)
+    and punctuation without spaces joins words ("hello,world" is 1).
+    """
     filename: str
     file_type: str
     full_text: str
@@ -47,126 +156,158 @@ class BaseDocumentProcessor(ABC):
         """Process a document and return structured data"""
         pass
     
+    @abstractmethod
+    def process_stream(self, stream: BinaryIO, filename: str) -> ProcessedDocument:
+        """Process an in-memory file-like object (e.g. an upload) without touching disk"""
+        pass
+    
     def extract_sections(self, text: str) -> List[DocumentSection]:
-        """Extract sections from text based on headings"""
-        sections = []
+        """Extract sections from text based on headings (see iter_sections)"""
+        return list(self.iter_sections(text))
+    
+    def iter_sections(self, text: str) -> Iterator[DocumentSection]:
+        """
+        Yield sections from text based on headings, one at a time
         
-        # Regex patterns for different heading formats
-        patterns = [
-            (r'^#{1,6}\s+(.+)$', 'markdown'),  # Markdown headers
-            (r'^([A-Z][A-Z\s]{3,})\s*$', 'all_caps'),  # ALL CAPS headers
-            (r'^(\d+\.(?:\d+\.)*)\s+(.+)$', 'numbered'),  # 1. 1.1. headers
-            (r'^([IVXLCDM]+\.\s+.+)$', 'roman'),  # Roman numerals
-        ]
+        Heading lines are found in one scan over the whole text; a section's
+        content is the non-blank lines up to the next heading (text before
+        the first heading goes to the first section)
+        """
+        # Prefix a newline so a heading on the first line is found too
+        text = '\n' + text
         
-        lines = text.split('\n')
-        current_section = None
-        content_buffer = []
-        
-        for i, line in enumerate(lines):
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
-            
-            is_heading = False
-            heading_level = 3  # Default level
-            heading_text = line_stripped
+        # A heading's section is yielded once the next heading (its end) is found
+        heading = None
+        heading_line = 0
+        preamble = ''  # text before the first heading, part of the first section
+        line_number = 0
+        previous_start = 0
+        for match in _HEADING_RE.finditer(text):
+            line_number += text.count('\n', previous_start, match.start())
+            previous_start = match.start()
             
-            # Check against patterns
-            for pattern, pattern_type in patterns:
-                match = re.match(pattern, line_stripped, re.MULTILINE)
-                if match:
-                    is_heading = True
-                    if pattern_type == 'markdown':
-                        heading_level = len(re.match(r'^#+', line_stripped).group())
-                        heading_text = match.group().lstrip('#').strip()
-                    elif pattern_type == 'numbered':
-                        heading_level = len(match.group(1).split('.'))
-                        heading_text = match.group(2)
-                    elif pattern_type in ['all_caps', 'roman']:
-                        heading_level = 2
-                        heading_text = match.group(1) if pattern_type == 'roman' else match.group()
-                    break
-            
-            if is_heading:
-                # Save previous section
-                if current_section:
-                    current_section.content = '\n'.join(content_buffer).strip()
-                    sections.append(current_section)
-                    content_buffer = []
-                
-                # Start new section
-                current_section = DocumentSection(
-                    title=heading_text,
-                    content="",
-                    level=heading_level,
-                    start_position=i
-                )
+            if heading is None:
+                preamble = text[:match.start()]
             else:
-                content_buffer.append(line)
-        
-        # Save last section
-        if current_section:
-            current_section.content = '\n'.join(content_buffer).strip()
-            sections.append(current_section)
+                yield self._heading_section(
+                    heading, preamble + text[heading.end():match.start()], heading_line
+                )
+                preamble = ''
+            
+            heading = match
+            heading_line = line_number
         
         # If no sections found, create a default one
-        if not sections:
-            sections.append(DocumentSection(
+        if heading is None:
+            yield DocumentSection(
                 title="Document Content",
-                content=text,
+                content=text[1:],
                 level=1
-            ))
+            )
+        else:
+            yield self._heading_section(heading, preamble + text[heading.end():], heading_line)
+    
+    @staticmethod
+    def _heading_section(match: re.Match, content: str, line_number: int) -> DocumentSection:
+        """Section for a _HEADING_RE match and the raw text that follows it"""
+        if match['md']:
+            heading_level = len(match['md'])
+            heading_text = match['md_title']
+        elif match['num']:
+            heading_level = match['num'].count('.') + 1
+            heading_text = match['num_title']
+        else:
+            heading_level = 2
+            heading_text = match['caps'] or match['roman']
         
-        return sections
+        return DocumentSection(
+            title=heading_text,
+            content=_BLANK_LINE_RE.sub('', content).strip(),
+            level=heading_level,
+            start_position=line_number
+        )
+    
+    def _describe_table(self, table: List[List]) -> str:
+        """Generate a text description of a table (first row is the header)"""
+        if not table or not table[0]:
+            return ""
+        
+        header = table[0]
+        columns = ", ".join([str(h) for h in header if h])
+        return f"Table with {len(table) - 1} rows and {len(header)} columns. Columns: {columns}. "
     
     def count_words(self, text: str) -> int:
         """Count words in text"""
-        return len(re.findall(r'\b\w+\b', text))
+        return _count_words(text)
+    
+    @staticmethod
+    def batch_count_words(texts: List[str]) -> List[int]:
+        """Count words in each of many texts (bulk statistics)"""
+        return [_count_words(text) for text in texts]
 
 
 class PDFProcessor(BaseDocumentProcessor):
-    """Process PDF files"""
+    """
+    Process PDF files
+    
+    With extract_tables=False, text is read with pypdfium2 (PDFium's C++
+    text extraction) and pdfplumber's layout analysis is skipped entirely
+    """
+    
+    def __init__(self, extract_tables: bool = True):
+        self.extract_tables = extract_tables
     
     def process(self, file_path: Path) -> ProcessedDocument:
         """Process a PDF file"""
-        full_text = ""
+        return self._process_source(file_path, file_path.name)
+    
+    def process_stream(self, stream: BinaryIO, filename: str) -> ProcessedDocument:
+        """Process a PDF from a binary stream"""
+        return self._process_source(stream, filename)
+    
+    def _process_source(self, source: Union[Path, BinaryIO], filename: str) -> ProcessedDocument:
+        """Extract text and tables from a PDF path or binary stream"""
+        parts = []  # page markers and page texts, joined once at the end
         tables = []
         total_pages = 0
         
         try:
-            # Try pdfplumber first (better for tables and layout)
-            with pdfplumber.open(file_path) as pdf:
-                total_pages = len(pdf.pages)
+            pages = self._extract_pages(source)
+            total_pages = len(pages)
+            
+            for page_num, (page_text, page_tables) in enumerate(pages, 1):
+                # Extract text
+                if page_text:
+                    parts.append(f"\n\n--- Page {page_num} ---\n\n")
+                    parts.append(page_text)
                 
-                for page_num, page in enumerate(pdf.pages, 1):
-                    # Extract text
-                    page_text = page.extract_text()
-                    if page_text:
-                        full_text += f"\n\n--- Page {page_num} ---\n\n"
-                        full_text += page_text
-                    
-                    # Extract tables
-                    page_tables = page.extract_tables()
-                    for table in page_tables:
-                        tables.append({
-                            'page': page_num,
-                            'data': table,
-                            'description': self._describe_table(table)
-                        })
+                # Extract tables
+                for table in page_tables:
+                    tables.append({
+                        'page': page_num,
+                        'data': table,
+                        'description': self._describe_table(table)
+                    })
         
         except Exception as e:
             # Fallback to PyPDF2
-            print(f"pdfplumber failed, using PyPDF2: {e}")
-            with open(file_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                total_pages = len(reader.pages)
-                
-                for page_num, page in enumerate(reader.pages, 1):
-                    page_text = page.extract_text()
-                    if page_text:
-                        full_text += f"\n\n--- Page {page_num} ---\n\n"
-                        full_text += page_text
+            import PyPDF2
+            
+            print(f"pypdfium2 failed, using PyPDF2: {e}")
+            parts = []
+            tables = []
+            if hasattr(source, 'seek'):
+                source.seek(0)
+            reader = PyPDF2.PdfReader(source)
+            total_pages = len(reader.pages)
+            
+            for page_num, page in enumerate(reader.pages, 1):
+                page_text = page.extract_text()
+                if page_text:
+                    parts.append(f"\n\n--- Page {page_num} ---\n\n")
+                    parts.append(page_text)
+        
+        full_text = "".join(parts)
         
         # Extract sections
         sections = self.extract_sections(full_text)
@@ -179,7 +320,7 @@ class PDFProcessor(BaseDocumentProcessor):
         }
         
         return ProcessedDocument(
-            filename=file_path.name,
+            filename=filename,
             file_type='pdf',
             full_text=full_text,
             sections=sections,
@@ -190,20 +331,76 @@ class PDFProcessor(BaseDocumentProcessor):
             total_words=self.count_words(full_text)
         )
     
-    def _describe_table(self, table: List[List]) -> str:
-        """Generate a text description of a table"""
-        if not table or not table[0]:
-            return ""
+    def _extract_pages(self, source: Union[Path, BinaryIO]) -> List[Tuple[Optional[str], List]]:
+        """
+        Text and tables of every page: pdfplumber when extracting tables,
+        pypdfium2 for text only or when pdfplumber cannot read the file
+        """
+        if self.extract_tables:
+            import pdfplumber
+            
+            try:
+                # pdfplumber first (better for tables and layout)
+                with pdfplumber.open(source) as pdf:
+                    total_pages = len(pdf.pages)
+                    
+                    if PDF_WORKERS > 1 and total_pages >= PDF_PARALLEL_MIN_PAGES:
+                        pages = None
+                    else:
+                        pages = [(page.extract_text(), page.extract_tables()) for page in pdf.pages]
+                
+                if pages is None:
+                    pages = self._extract_pages_parallel(source, total_pages)
+                return pages
+            except Exception as e:
+                print(f"pdfplumber failed, using pypdfium2: {e}")
+                if hasattr(source, 'seek'):
+                    source.seek(0)
         
-        # Assume first row is header
-        header = table[0]
-        num_rows = len(table) - 1
-        num_cols = len(header)
+        return self._extract_text_pages(source)
+    
+    def _extract_text_pages(self, source: Union[Path, BinaryIO]) -> List[Tuple[Optional[str], List]]:
+        """Text of every page via pypdfium2 (no tables), in the same shape as pdfplumber pages"""
+        import pypdfium2 as pdfium
         
-        description = f"Table with {num_rows} rows and {num_cols} columns. "
-        description += f"Columns: {', '.join(str(h) for h in header if h)}. "
+        pages = []
+        pdf = pdfium.PdfDocument(source)
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                # PDFium ends lines with CRLF; pdfplumber and PyPDF2 use LF
+                pages.append((textpage.get_text_range().replace('\r\n', '\n'), []))
+                textpage.close()
+                page.close()
+        finally:
+            pdf.close()
+        return pages
+    
+    def _extract_pages_parallel(
+        self,
+        source: Union[Path, BinaryIO],
+        total_pages: int
+    ) -> List[Tuple[Optional[str], List]]:
+        """
+        Extract page text and tables in worker processes, one contiguous page
+        range per worker, returned in page order
+        """
+        if hasattr(source, 'read'):
+            source.seek(0)
+            source = source.read()
         
-        return description
+        step = -(-total_pages // PDF_WORKERS)
+        starts = range(0, total_pages, step)
+        
+        with ProcessPoolExecutor(
+            max_workers=len(starts),
+            mp_context=_WORKER_CONTEXT
+        ) as executor:
+            futures = [
+                executor.submit(_extract_pdf_pages, source, start, start + step)
+                for start in starts
+            ]
+            return [page for future in futures for page in future.result()]
 
 
 class DOCXProcessor(BaseDocumentProcessor):
@@ -211,19 +408,34 @@ class DOCXProcessor(BaseDocumentProcessor):
     
     def process(self, file_path: Path) -> ProcessedDocument:
         """Process a DOCX file"""
-        doc = Document(file_path)
+        return self._process_source(file_path, file_path.name)
+    
+    def process_stream(self, stream: BinaryIO, filename: str) -> ProcessedDocument:
+        """Process a DOCX document from a binary stream"""
+        return self._process_source(stream, filename)
+    
+    def _process_source(self, source: Union[Path, BinaryIO], filename: str) -> ProcessedDocument:
+        """Extract structured text from a DOCX path or binary stream"""
+        from docx import Document
+        
+        doc = Document(source)
         
-        full_text = ""
+        parts = []  # text of every paragraph and table, joined once at the end
         sections = []
         tables = []
         
-        current_section = None
+        current_heading = None  # (title, level) of the section being collected
         content_buffer = []
         
+        # Paragraph/table objects by their XML element, for O(1) lookups
+        paragraphs = doc.paragraphs
+        para_by_element = {p._element: p for p in paragraphs}
+        table_by_element = {t._element: t for t in doc.tables}
+        
         for element in doc.element.body:
             # Process paragraphs
             if element.tag.endswith('p'):
-                para = next((p for p in doc.paragraphs if p._element == element), None)
+                para = para_by_element.get(element)
                 if para:
                     text = para.text.strip()
                     if not text:
@@ -234,40 +446,46 @@ class DOCXProcessor(BaseDocumentProcessor):
                         level = int(para.style.name.replace('Heading ', ''))
                         
                         # Save previous section
-                        if current_section:
-                            current_section.content = '\n'.join(content_buffer).strip()
-                            sections.append(current_section)
+                        if current_heading:
+                            sections.append(DocumentSection(
+                                title=current_heading[0],
+                                content='\n'.join(content_buffer).strip(),
+                                level=current_heading[1]
+                            ))
                             content_buffer = []
                         
                         # Start new section
-                        current_section = DocumentSection(
-                            title=text,
-                            content="",
-                            level=level
-                        )
+                        current_heading = (text, level)
                     else:
                         content_buffer.append(text)
-                        full_text += text + "\n"
+                        parts.append(text)
+                        parts.append("\n")
             
             # Process tables
             elif element.tag.endswith('tbl'):
-                table = next((t for t in doc.tables if t._element == element), None)
+                table = table_by_element.get(element)
                 if table:
                     table_data = [[cell.text for cell in row.cells] for row in table.rows]
+                    description = self._describe_table(table_data)
                     tables.append({
                         'data': table_data,
-                        'description': self._describe_table(table_data)
+                        'description': description
                     })
                     
                     # Add table description to text
-                    table_text = f"\n[TABLE: {self._describe_table(table_data)}]\n"
+                    table_text = f"\n[TABLE: {description}]\n"
                     content_buffer.append(table_text)
-                    full_text += table_text
+                    parts.append(table_text)
+        
+        full_text = "".join(parts)
         
         # Save last section
-        if current_section:
-            current_section.content = '\n'.join(content_buffer).strip()
-            sections.append(current_section)
+        if current_heading:
+            sections.append(DocumentSection(
+                title=current_heading[0],
+                content='\n'.join(content_buffer).strip(),
+                level=current_heading[1]
+            ))
         
         # If no sections, create default
         if not sections:
@@ -280,11 +498,11 @@ class DOCXProcessor(BaseDocumentProcessor):
         metadata = {
             'has_tables': len(tables) > 0,
             'table_count': len(tables),
-            'paragraph_count': len(doc.paragraphs)
+            'paragraph_count': len(paragraphs)
         }
         
         return ProcessedDocument(
-            filename=file_path.name,
+            filename=filename,
             file_type='docx',
             full_text=full_text,
             sections=sections,
@@ -293,20 +511,6 @@ class DOCXProcessor(BaseDocumentProcessor):
             total_chars=len(full_text),
             total_words=self.count_words(full_text)
         )
-    
-    def _describe_table(self, table: List[List]) -> str:
-        """Generate a text description of a table"""
-        if not table or not table[0]:
-            return ""
-        
-        header = table[0]
-        num_rows = len(table) - 1
-        num_cols = len(header)
-        
-        description = f"Table with {num_rows} rows and {num_cols} columns. "
-        description += f"Columns: {', '.join(str(h) for h in header if h)}. "
-        
-        return description
 
 
 class TextProcessor(BaseDocumentProcessor):
@@ -314,19 +518,27 @@ class TextProcessor(BaseDocumentProcessor):
     
     def process(self, file_path: Path) -> ProcessedDocument:
         """Process a text or markdown file"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            full_text = f.read()
-        
+        full_text = file_path.read_text(encoding='utf-8')
+        return self._build_document(full_text, file_path.name)
+    
+    def process_stream(self, stream: BinaryIO, filename: str) -> ProcessedDocument:
+        """Process text or markdown from a binary stream"""
+        full_text = stream.read().decode('utf-8')
+        return self._build_document(full_text, filename)
+    
+    def _build_document(self, full_text: str, filename: str) -> ProcessedDocument:
+        """Build a ProcessedDocument from decoded text"""
+        suffix = Path(filename).suffix.lower()
         sections = self.extract_sections(full_text)
         
         metadata = {
             'encoding': 'utf-8',
-            'is_markdown': file_path.suffix.lower() in ['.md', '.markdown']
+            'is_markdown': suffix in ['.md', '.markdown']
         }
         
         return ProcessedDocument(
-            filename=file_path.name,
-            file_type=file_path.suffix.lower().lstrip('.'),
+            filename=filename,
+            file_type=suffix.lstrip('.'),
             full_text=full_text,
             sections=sections,
             metadata=metadata,
@@ -336,25 +548,130 @@ class TextProcessor(BaseDocumentProcessor):
         )
 
 
+# Processor class per file extension
+PROCESSOR_REGISTRY: Dict[str, Type[BaseDocumentProcessor]] = {
+    '.pdf': PDFProcessor,
+    '.docx': DOCXProcessor,
+    '.txt': TextProcessor,
+    '.md': TextProcessor,
+    '.markdown': TextProcessor,
+}
+
+# Shared processor instances by file extension; processors hold no per-call
+# state, so one instance per class can serve every file (and every thread)
+_INSTANCES: Dict[Type[BaseDocumentProcessor], BaseDocumentProcessor] = {
+    cls: cls() for cls in dict.fromkeys(PROCESSOR_REGISTRY.values())
+}
+_PROCESSORS: Dict[str, BaseDocumentProcessor] = {
+    suffix: _INSTANCES[cls] for suffix, cls in PROCESSOR_REGISTRY.items()
+}
+_TEXT_ONLY_PDF_PROCESSOR = PDFProcessor(extract_tables=False)
+
+
 class DocumentProcessorFactory:
     """Factory to get the appropriate processor for a file"""
     
     @staticmethod
-    def get_processor(file_path: Path) -> BaseDocumentProcessor:
-        """Get the appropriate processor based on file extension"""
-        suffix = file_path.suffix.lower()
-        
-        if suffix == '.pdf':
-            return PDFProcessor()
-        elif suffix == '.docx':
-            return DOCXProcessor()
-        elif suffix in ['.txt', '.md', '.markdown']:
-            return TextProcessor()
-        else:
+    def register(suffixes: List[str], processor_cls: Type[BaseDocumentProcessor]):
+        """Register a processor class for file extensions (e.g. ['.html'])"""
+        processor = _INSTANCES.get(processor_cls)
+        if processor is None:
+            processor = _INSTANCES[processor_cls] = processor_cls()
+        
+        for suffix in suffixes:
+            suffix = suffix.lower()
+            PROCESSOR_REGISTRY[suffix] = processor_cls
+            _PROCESSORS[suffix] = processor
+    
+    @staticmethod
+    def get_processor_cls(file_path: Union[str, Path]) -> Type[BaseDocumentProcessor]:
+        """Get the processor class for a file extension, without an instance"""
+        suffix = os.path.splitext(file_path)[1].lower()
+        processor_cls = PROCESSOR_REGISTRY.get(suffix)
+        if processor_cls is None:
             raise ValueError(f"Unsupported file type: {suffix}")
+        return processor_cls
     
     @staticmethod
-    def process_document(file_path: Path) -> ProcessedDocument:
+    def get_processor(
+        file_path: Union[str, Path],
+        extract_tables: Optional[bool] = None
+    ) -> BaseDocumentProcessor:
+        """
+        Get the appropriate processor based on file extension
+        
+        file_path may be a Path or a plain filename. extract_tables=False lets
+        PDFs skip table extraction for a much faster text-only backend; None
+        follows settings.enable_table_extraction
+        """
+        suffix = os.path.splitext(file_path)[1].lower()
+        if extract_tables is None:
+            extract_tables = settings.enable_table_extraction
+        
+        if suffix == '.pdf' and not extract_tables:
+            return _TEXT_ONLY_PDF_PROCESSOR
+        
+        processor = _PROCESSORS.get(suffix)
+        if processor is None:
+            raise ValueError(f"Unsupported file type: {suffix}")
+        return processor
+    
+    @staticmethod
+    def process_document(
+        file_path: Path,
+        extract_tables: Optional[bool] = None
+    ) -> ProcessedDocument:
         """Process a document with the appropriate processor"""
-        processor = DocumentProcessorFactory.get_processor(file_path)
+        processor = DocumentProcessorFactory.get_processor(file_path, extract_tables)
         return processor.process(file_path)
+    
+    @staticmethod
+    def process_stream(
+        stream: BinaryIO,
+        filename: str,
+        extract_tables: Optional[bool] = None
+    ) -> ProcessedDocument:
+        """
+        Process an in-memory document (e.g. a Streamlit upload)
+        
+        The processor is chosen from the filename extension, exactly as for
+        paths, but the content is parsed straight from the stream.
+        """
+        processor = DocumentProcessorFactory.get_processor(filename, extract_tables)
+        return processor.process_stream(stream, filename)
+    
+    @staticmethod
+    def process_many(
+        file_paths: List[Path],
+        extract_tables: Optional[bool] = None,
+        max_workers: Optional[int] = None
+    ) -> List[ProcessedDocument]:
+        """
+        Process several documents, one file per worker process, returned in
+        input order (sequentially when only one worker would be used)
+        """
+        file_paths = [Path(file_path) for file_path in file_paths]
+        if extract_tables is None:
+            extract_tables = settings.enable_table_extraction
+        
+        # Fail on unsupported files before any worker is started
+        for file_path in file_paths:
+            DocumentProcessorFactory.get_processor(file_path, extract_tables)
+        
+        workers = min(max_workers or DOCUMENT_WORKERS, len(file_paths))
+        if workers <= 1:
+            return [
+                DocumentProcessorFactory.process_document(file_path, extract_tables)
+                for file_path in file_paths
+            ]
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=_WORKER_CONTEXT,
+            initializer=_serial_page_extraction
+        ) as executor:
+            return list(executor.map(
+                DocumentProcessorFactory.process_document,
+                file_paths,
+                [extract_tables] * len(file_paths)
+            ))
@@ -2,20 +2,157 @@
 Summarization Strategies
 Implements Stuff, Map-Reduce, and Refine chains for different document types
 """
-from typing import List, Dict, Optional
+import asyncio
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
 
+from langchain.chains import LLMChain
+from langchain.chains.base import Chain
+from langchain.chains.combine_documents.reduce import ReduceDocumentsChain
+from langchain.chains.combine_documents.stuff import StuffDocumentsChain
 from langchain.chains.summarize import load_summarize_chain
 from langchain.prompts import PromptTemplate
 from langchain.docstore.document import Document as LangChainDocument
 
 from src.core.chunking_engine import TextChunk
+from src.core.chunk_selection import score_chunks, select_top_k_chunks
 from src.models.llm_manager import llm_manager
-from config.settings import SUMMARY_LEVELS, SUMMARY_STYLES
+from config.settings import settings, SUMMARY_LEVELS, SUMMARY_STYLES
+from src.utils.async_runner import run_async
+from src.utils.hashing import content_hash
 
 
-@dataclass
+# Shared opening of every prompt; kept byte-identical so providers can reuse
+# the cached prompt prefix across levels, strategies and documents
+PROMPT_PREAMBLE = """You are an expert document analyst. Summarize only the text provided, \
+faithfully and without adding outside information."""
+
+# Neutral per-chunk prompt for the map step, independent of summary type/style
+MAP_TEMPLATE = PROMPT_PREAMBLE + """
+
+Write a concise summary of the following section:
+
+{text}
+
+SECTION SUMMARY:"""
+_MAP_PROMPT_HASH = content_hash(MAP_TEMPLATE)
+
+# Level-specific instruction and answer label, placed after the text
+LEVEL_INSTRUCTIONS = {
+    "tldr": (
+        "Write a concise TL;DR (1-2 sentences) of the text above.",
+        "TL;DR"
+    ),
+    "bullet": (
+        "Summarize the text above as 5-7 clear bullet points.",
+        "BULLET SUMMARY"
+    ),
+    "executive": (
+        """Write an executive summary of the text above.
+Include:
+- Main purpose/objective
+- Key findings or points
+- Conclusions or recommendations
+
+Maximum length: {max_length} words""",
+        "EXECUTIVE SUMMARY"
+    ),
+    "detailed": (
+        """Write a comprehensive, detailed summary of the text above.
+Include:
+- Full context and background
+- All major points and supporting details
+- Methodology (if applicable)
+- Key findings and evidence
+- Conclusions and implications
+
+Preserve the logical flow and structure.
+Maximum length: {max_length} words""",
+        "DETAILED SUMMARY"
+    ),
+}
+DEFAULT_INSTRUCTION = ("Summarize the text above clearly and comprehensively.", "SUMMARY")
+
+_BLANK_RUN_RE = re.compile(r"\n{3,}")
+
+
+def normalize_text(text: str) -> str:
+    """Collapse runs of spaces/tabs and blank lines, keeping paragraph breaks"""
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    return _BLANK_RUN_RE.sub("\n\n", "\n".join(lines)).strip()
+
+
+# (model, temperature, map prompt hash) a map summary was produced with
+MapNamespace = Tuple[str, Optional[float], str]
+
+# Map summaries shared across runs and documents, keyed by (namespace,
+# chunk_hash): repeated boilerplate (headers, footers, disclaimers) is
+# summarized once per model, temperature and map prompt. Least recently used
+# entries go first beyond settings.map_cache_size.
+_map_summary_cache: "OrderedDict[Tuple[MapNamespace, str], str]" = OrderedDict()
+_map_summary_lock = threading.Lock()
+
+
+def _get_map_summaries(namespace: MapNamespace, keys: List[str]) -> Dict[str, str]:
+    """Shared map summaries for the given chunk hashes (misses are left out)"""
+    if not settings.enable_cache:
+        return {}
+    
+    found = {}
+    with _map_summary_lock:
+        for key in keys:
+            summary = _map_summary_cache.get((namespace, key))
+            if summary is not None:
+                _map_summary_cache.move_to_end((namespace, key))
+                found[key] = summary
+    return found
+
+
+def _store_map_summaries(namespace: MapNamespace, summaries: Dict[str, str]):
+    """Add map summaries to the shared cache"""
+    if not settings.enable_cache:
+        return
+    
+    with _map_summary_lock:
+        for key, summary in summaries.items():
+            _map_summary_cache[(namespace, key)] = summary
+            _map_summary_cache.move_to_end((namespace, key))
+        while len(_map_summary_cache) > settings.map_cache_size:
+            _map_summary_cache.popitem(last=False)
+
+
+@lru_cache(maxsize=64)
+def _build_prompt_template(summary_type: str, style: str) -> str:
+    """
+    Prompt template for a summary type and style
+    
+    Static parts come first and the level-specific instruction last, so
+    every level sends the same prefix for the same text
+    """
+    summary_config = SUMMARY_LEVELS.get(summary_type, SUMMARY_LEVELS['executive'])
+    style_instruction = SUMMARY_STYLES.get(style, SUMMARY_STYLES['executive'])
+    instruction, label = LEVEL_INSTRUCTIONS.get(summary_type, DEFAULT_INSTRUCTION)
+    instruction = instruction.format(max_length=summary_config.get('max_length'))
+    
+    return f"""{PROMPT_PREAMBLE}
+
+Style: {style_instruction}
+
+Text:
+{{text}}
+
+{instruction}
+
+{label}:"""
+
+
+@dataclass(slots=True)
 class SummaryResult:
     """Result of a summarization operation"""
     content: str
@@ -29,103 +166,119 @@ class SummaryResult:
 class BaseSummarizationStrategy(ABC):
     """Base class for summarization strategies"""
     
+    strategy_name: str = ""
+    
     def __init__(self, model_name: Optional[str] = None):
         self.model_name = model_name
         self.llm = llm_manager.get_model(model_name)
     
     @abstractmethod
+    def _build_chain(
+        self,
+        docs: List[LangChainDocument],
+        summary_type: str,
+        style: str,
+        map_cache: Optional[Dict[str, str]]
+    ) -> Tuple[Chain, List[LangChainDocument], Dict]:
+        """Build the chain, its input documents and strategy-specific metadata"""
+        pass
+    
     def summarize(
         self,
         chunks: List[TextChunk],
         summary_type: str = "executive",
-        style: str = "professional"
+        style: str = "professional",
+        map_cache: Optional[Dict[str, str]] = None
     ) -> SummaryResult:
-        """Summarize chunks of text"""
-        pass
+        """
+        Summarize chunks of text
+        
+        map_cache holds per-chunk map summaries keyed by chunk_hash; only
+        strategies with a map step use it
+        """
+        docs = self._chunks_to_langchain_docs(chunks)
+        return self.summarize_docs(docs, summary_type, style, map_cache)
+    
+    async def asummarize(
+        self,
+        chunks: List[TextChunk],
+        summary_type: str = "executive",
+        style: str = "professional",
+        map_cache: Optional[Dict[str, str]] = None
+    ) -> SummaryResult:
+        """Async variant of summarize - awaits the LLM calls instead of blocking"""
+        docs = self._chunks_to_langchain_docs(chunks)
+        return await self.asummarize_docs(docs, summary_type, style, map_cache)
+    
+    def summarize_docs(
+        self,
+        docs: List[LangChainDocument],
+        summary_type: str = "executive",
+        style: str = "professional",
+        map_cache: Optional[Dict[str, str]] = None
+    ) -> SummaryResult:
+        """Summarize chunks already converted with _chunks_to_langchain_docs"""
+        chain, chain_docs, metadata = self._build_chain(docs, summary_type, style, map_cache)
+        result = chain.run(chain_docs)
+        return self._to_result(result, docs, summary_type, style, metadata)
+    
+    async def asummarize_docs(
+        self,
+        docs: List[LangChainDocument],
+        summary_type: str = "executive",
+        style: str = "professional",
+        map_cache: Optional[Dict[str, str]] = None
+    ) -> SummaryResult:
+        """Async variant of summarize_docs"""
+        chain, chain_docs, metadata = self._build_chain(docs, summary_type, style, map_cache)
+        result = await chain.arun(chain_docs)
+        return self._to_result(result, docs, summary_type, style, metadata)
     
-    def _chunks_to_langchain_docs(self, chunks: List[TextChunk]) -> List[LangChainDocument]:
-        """Convert TextChunks to LangChain Documents"""
+    def _to_result(
+        self,
+        result: str,
+        docs: List[LangChainDocument],
+        summary_type: str,
+        style: str,
+        metadata: Dict
+    ) -> SummaryResult:
+        """Wrap raw chain output in a SummaryResult"""
+        return SummaryResult(
+            content=result.strip(),
+            summary_type=summary_type,
+            strategy_used=self.strategy_name,
+            model_used=self.model_name or "default",
+            total_chunks=len(docs),
+            metadata={'style': style, **metadata}
+        )
+    
+    @staticmethod
+    def _chunks_to_langchain_docs(chunks: List[TextChunk]) -> List[LangChainDocument]:
+        """
+        Convert TextChunks to LangChain Documents
+        
+        page_content is the normalized chunk text and metadata carries its
+        chunk_hash, so both are computed once however many levels use a chunk
+        """
         docs = []
         for chunk in chunks:
+            page_content = normalize_text(chunk.content)
             metadata = {
                 'chunk_id': chunk.chunk_id,
                 'section_title': chunk.section_title,
                 'section_level': chunk.section_level,
-                'token_count': chunk.token_count
+                'token_count': chunk.token_count,
+                'chunk_hash': content_hash(page_content)
             }
             docs.append(LangChainDocument(
-                page_content=chunk.content,
+                page_content=page_content,
                 metadata=metadata
             ))
         return docs
     
     def _get_prompt_template(self, summary_type: str, style: str) -> str:
         """Get prompt template based on summary type and style"""
-        summary_config = SUMMARY_LEVELS.get(summary_type, SUMMARY_LEVELS['executive'])
-        style_instruction = SUMMARY_STYLES.get(style, SUMMARY_STYLES['executive'])
-        
-        if summary_type == "tldr":
-            return f"""Write a concise TL;DR (1-2 sentences) of the following text.
-            
-Style: {style_instruction}
-
-Text:
-{{text}}
-
-TL;DR:"""
-        
-        elif summary_type == "bullet":
-            return f"""Summarize the following text as 5-7 clear bullet points.
-
-Style: {style_instruction}
-
-Text:
-{{text}}
-
-BULLET SUMMARY:"""
-        
-        elif summary_type == "executive":
-            return f"""Write an executive summary of the following text.
-Include:
-- Main purpose/objective
-- Key findings or points
-- Conclusions or recommendations
-
-Maximum length: {summary_config['max_length']} words
-Style: {style_instruction}
-
-Text:
-{{text}}
-
-EXECUTIVE SUMMARY:"""
-        
-        elif summary_type == "detailed":
-            return f"""Write a comprehensive, detailed summary of the following text.
-Include:
-- Full context and background
-- All major points and supporting details
-- Methodology (if applicable)
-- Key findings and evidence
-- Conclusions and implications
-
-Preserve the logical flow and structure.
-Maximum length: {summary_config['max_length']} words
-Style: {style_instruction}
-
-Text:
-{{text}}
-
-DETAILED SUMMARY:"""
-        
-        else:
-            return f"""Summarize the following text clearly and comprehensively.
-
-Style: {style_instruction}
-
-Text:
-{{text}}
-
-SUMMARY:"""
+        return _build_prompt_template(summary_type, style)
 
 
 class StuffStrategy(BaseSummarizationStrategy):
@@ -134,43 +287,34 @@ class StuffStrategy(BaseSummarizationStrategy):
     Best for: Short documents (<4000 tokens)
     """
     
-    def summarize(
+    strategy_name = "stuff"
+    
+    def _build_chain(
         self,
-        chunks: List[TextChunk],
-        summary_type: str = "executive",
-        style: str = "professional"
-    ) -> SummaryResult:
-        """Summarize using stuff strategy"""
+        docs: List[LangChainDocument],
+        summary_type: str,
+        style: str,
+        map_cache: Optional[Dict[str, str]]
+    ) -> Tuple[Chain, List[LangChainDocument], Dict]:
+        """Build a single-prompt stuff chain over the combined text"""
         
         # Combine all chunks into one text
-        combined_text = "\n\n".join([chunk.content for chunk in chunks])
+        combined_text = "\n\n".join([doc.page_content for doc in docs])
         
         # Get prompt
         prompt_template = self._get_prompt_template(summary_type, style)
         prompt = PromptTemplate(template=prompt_template, input_variables=["text"])
         
         # Create chain
-        docs = [LangChainDocument(page_content=combined_text)]
         chain = load_summarize_chain(
             llm=self.llm,
             chain_type="stuff",
             prompt=prompt
         )
         
-        # Run summarization
-        result = chain.run(docs)
-        
-        return SummaryResult(
-            content=result.strip(),
-            summary_type=summary_type,
-            strategy_used="stuff",
-            model_used=self.model_name or "default",
-            total_chunks=len(chunks),
-            metadata={
-                'style': style,
-                'combined_length': len(combined_text)
-            }
-        )
+        return chain, [LangChainDocument(page_content=combined_text)], {
+            'combined_length': len(combined_text)
+        }
 
 
 class MapReduceStrategy(BaseSummarizationStrategy):
@@ -179,53 +323,174 @@ class MapReduceStrategy(BaseSummarizationStrategy):
     Best for: Long documents (4000-100000 tokens)
     """
     
-    def summarize(
+    strategy_name = "map_reduce"
+    
+    def _map_chain(self) -> LLMChain:
+        """Chain for the neutral per-chunk map prompt"""
+        map_prompt = PromptTemplate(template=MAP_TEMPLATE, input_variables=["text"])
+        return LLMChain(llm=self.llm, prompt=map_prompt)
+    
+    def _pending_docs(
+        self,
+        docs: List[LangChainDocument],
+        map_cache: Dict[str, str]
+    ) -> Dict[str, LangChainDocument]:
+        """
+        Chunks that still need a map summary, keyed by chunk_hash
+        
+        Summaries found in the shared cache are copied into map_cache first
+        """
+        pending = {}
+        for doc in docs:
+            key = doc.metadata['chunk_hash']
+            if key not in map_cache:
+                pending.setdefault(key, doc)
+        
+        cached = _get_map_summaries(self._map_namespace, list(pending))
+        map_cache.update(cached)
+        for key in cached:
+            del pending[key]
+        return pending
+    
+    @property
+    def _map_namespace(self) -> MapNamespace:
+        """Model, temperature and map prompt the shared map summaries are stored under"""
+        return (
+            self.model_name or settings.default_model,
+            getattr(self.llm, 'temperature', None),
+            _MAP_PROMPT_HASH
+        )
+    
+    def map_chunks(
         self,
         chunks: List[TextChunk],
-        summary_type: str = "executive",
-        style: str = "professional"
-    ) -> SummaryResult:
-        """Summarize using map-reduce strategy"""
+        map_cache: Optional[Dict[str, str]] = None
+    ) -> Dict[str, str]:
+        """
+        Run the map step: one neutral summary per chunk
         
-        # Convert chunks to LangChain documents
-        docs = self._chunks_to_langchain_docs(chunks)
+        Results are stored in map_cache (keyed by chunk_hash) so they can be
+        reused across summary levels; chunks already present are skipped.
+        Chunks are summarized in parallel, up to settings.max_concurrent_jobs
+        requests at a time.
+        """
+        return self.map_docs(self._chunks_to_langchain_docs(chunks), map_cache)
+    
+    async def amap_chunks(
+        self,
+        chunks: List[TextChunk],
+        map_cache: Optional[Dict[str, str]] = None
+    ) -> Dict[str, str]:
+        """Async variant of map_chunks, bounded by an asyncio.Semaphore"""
+        return await self.amap_docs(self._chunks_to_langchain_docs(chunks), map_cache)
+    
+    def map_docs(
+        self,
+        docs: List[LangChainDocument],
+        map_cache: Optional[Dict[str, str]] = None
+    ) -> Dict[str, str]:
+        """map_chunks for chunks already converted to LangChain documents"""
+        if map_cache is None:
+            map_cache = {}
         
-        # Map prompt - summarize individual chunks
-        map_template = f"""Write a concise summary of the following section:
-
-{{text}}
-
-SECTION SUMMARY:"""
+        pending = self._pending_docs(docs, map_cache)
+        if not pending:
+            return map_cache
         
-        map_prompt = PromptTemplate(template=map_template, input_variables=["text"])
+        map_chain = self._map_chain()
+        
+        def summarize_doc(doc: LangChainDocument) -> str:
+            return map_chain.run(text=doc.page_content).strip()
+        
+        with ThreadPoolExecutor(max_workers=settings.max_concurrent_jobs) as executor:
+            summaries = dict(zip(pending.keys(), executor.map(summarize_doc, pending.values())))
+        
+        map_cache.update(summaries)
+        _store_map_summaries(self._map_namespace, summaries)
+        return map_cache
+    
+    async def amap_docs(
+        self,
+        docs: List[LangChainDocument],
+        map_cache: Optional[Dict[str, str]] = None
+    ) -> Dict[str, str]:
+        """Async variant of map_docs"""
+        if map_cache is None:
+            map_cache = {}
+        
+        pending = self._pending_docs(docs, map_cache)
+        if not pending:
+            return map_cache
+        
+        map_chain = self._map_chain()
+        semaphore = asyncio.Semaphore(settings.max_concurrent_jobs)
+        
+        async def summarize_doc(doc: LangChainDocument) -> str:
+            async with semaphore:
+                return (await map_chain.arun(text=doc.page_content)).strip()
+        
+        results = await asyncio.gather(*(
+            summarize_doc(doc) for doc in pending.values()
+        ))
+        summaries = dict(zip(pending.keys(), results))
+        
+        map_cache.update(summaries)
+        _store_map_summaries(self._map_namespace, summaries)
+        return map_cache
+    
+    def summarize_docs(
+        self,
+        docs: List[LangChainDocument],
+        summary_type: str = "executive",
+        style: str = "professional",
+        map_cache: Optional[Dict[str, str]] = None
+    ) -> SummaryResult:
+        """Summarize using map-reduce strategy"""
+        # Map step - summarize individual chunks (reusing cached results)
+        map_cache = self.map_docs(docs, map_cache)
+        return super().summarize_docs(docs, summary_type, style, map_cache)
+    
+    async def asummarize_docs(
+        self,
+        docs: List[LangChainDocument],
+        summary_type: str = "executive",
+        style: str = "professional",
+        map_cache: Optional[Dict[str, str]] = None
+    ) -> SummaryResult:
+        """Async variant of summarize_docs"""
+        map_cache = await self.amap_docs(docs, map_cache)
+        return await super().asummarize_docs(docs, summary_type, style, map_cache)
+    
+    def _build_chain(
+        self,
+        docs: List[LangChainDocument],
+        summary_type: str,
+        style: str,
+        map_cache: Optional[Dict[str, str]]
+    ) -> Tuple[Chain, List[LangChainDocument], Dict]:
+        """Build the reduce chain over the already mapped chunk summaries"""
+        summary_docs = [
+            LangChainDocument(
+                page_content=map_cache[doc.metadata['chunk_hash']],
+                metadata={'chunk_id': doc.metadata['chunk_id']}
+            )
+            for doc in docs
+        ]
         
         # Reduce prompt - combine summaries
         reduce_template = self._get_prompt_template(summary_type, style)
         reduce_prompt = PromptTemplate(template=reduce_template, input_variables=["text"])
         
-        # Create chain
-        chain = load_summarize_chain(
-            llm=self.llm,
-            chain_type="map_reduce",
-            map_prompt=map_prompt,
-            combine_prompt=reduce_prompt,
-            return_intermediate_steps=False
+        # Create reduce chain (collapses summaries that exceed token_max)
+        chain = ReduceDocumentsChain(
+            combine_documents_chain=StuffDocumentsChain(
+                llm_chain=LLMChain(llm=self.llm, prompt=reduce_prompt),
+                document_variable_name="text"
+            ),
+            token_max=3000
         )
         
-        # Run summarization
-        result = chain.run(docs)
-        
-        return SummaryResult(
-            content=result.strip(),
-            summary_type=summary_type,
-            strategy_used="map_reduce",
-            model_used=self.model_name or "default",
-            total_chunks=len(chunks),
-            metadata={
-                'style': style,
-                'num_sections': len(docs)
-            }
-        )
+        return chain, summary_docs, {'num_sections': len(summary_docs)}
 
 
 class RefineStrategy(BaseSummarizationStrategy):
@@ -234,23 +499,27 @@ class RefineStrategy(BaseSummarizationStrategy):
     Best for: Premium quality summaries where quality > speed
     """
     
-    def summarize(
+    strategy_name = "refine"
+    
+    def _build_chain(
         self,
-        chunks: List[TextChunk],
-        summary_type: str = "executive",
-        style: str = "professional"
-    ) -> SummaryResult:
-        """Summarize using refine strategy"""
-        
-        # Convert chunks to LangChain documents
-        docs = self._chunks_to_langchain_docs(chunks)
+        docs: List[LangChainDocument],
+        summary_type: str,
+        style: str,
+        map_cache: Optional[Dict[str, str]]
+    ) -> Tuple[Chain, List[LangChainDocument], Dict]:
+        """Build an iterative refine chain over the chunks"""
         
         # Initial prompt - for first chunk
         initial_template = self._get_prompt_template(summary_type, style)
         initial_prompt = PromptTemplate(template=initial_template, input_variables=["text"])
         
         # Refine prompt - for subsequent chunks
-        refine_template = f"""You are working on producing a {summary_type} summary.
+        refine_template = f"""{PROMPT_PREAMBLE}
+
+Style: {SUMMARY_STYLES.get(style, SUMMARY_STYLES['executive'])}
+
+You are working on producing a {summary_type} summary.
 We have an existing summary up to this point:
 
 {{existing_answer}}
@@ -262,8 +531,6 @@ Now you have the opportunity to refine this summary with additional context:
 Given this new context, refine and improve the existing summary.
 If the new context is not relevant, return the existing summary unchanged.
 
-Style: {SUMMARY_STYLES.get(style, SUMMARY_STYLES['executive'])}
-
 REFINED SUMMARY:"""
         
         refine_prompt = PromptTemplate(
@@ -280,20 +547,41 @@ REFINED SUMMARY:"""
             return_intermediate_steps=False
         )
         
-        # Run summarization
-        result = chain.run(docs)
-        
-        return SummaryResult(
-            content=result.strip(),
-            summary_type=summary_type,
-            strategy_used="refine",
-            model_used=self.model_name or "default",
-            total_chunks=len(chunks),
-            metadata={
-                'style': style,
-                'num_refinements': len(docs) - 1
-            }
-        )
+        return chain, docs, {'num_refinements': len(docs) - 1}
+
+
+@lru_cache(maxsize=256)
+def _select_strategy_cached(token_bucket: int, quality_preference: str) -> str:
+    """
+    Strategy decision for a 1000-token bucket
+    
+    All STRATEGY_THRESHOLDS boundaries are multiples of 1000, so deciding on
+    the bucket's lower bound gives the same answer as the exact count
+    """
+    tokens = token_bucket * 1000
+    
+    # For very short documents, use stuff
+    if tokens < 4000:
+        return "stuff"
+    
+    # For premium quality preference, use refine
+    if quality_preference == "premium" and tokens < 50000:
+        return "refine"
+    
+    # For very long documents, map-reduce is more efficient
+    if tokens > 50000:
+        return "map_reduce"
+    
+    # Default to map-reduce for balanced approach
+    if quality_preference == "balanced":
+        return "map_reduce"
+    
+    # For fast preference, use map-reduce (parallelizable)
+    if quality_preference == "fast":
+        return "map_reduce"
+    
+    # Default
+    return "map_reduce"
 
 
 class StrategySelectorr:
@@ -316,29 +604,7 @@ class StrategySelectorr:
         Returns:
             Strategy name: "stuff", "map_reduce", or "refine"
         """
-        
-        # For very short documents, use stuff
-        if total_tokens < 4000:
-            return "stuff"
-        
-        # For premium quality preference, use refine
-        if quality_preference == "premium" and total_tokens < 50000:
-            return "refine"
-        
-        # For very long documents, map-reduce is more efficient
-        if total_tokens > 50000:
-            return "map_reduce"
-        
-        # Default to map-reduce for balanced approach
-        if quality_preference == "balanced":
-            return "map_reduce"
-        
-        # For fast preference, use map-reduce (parallelizable)
-        if quality_preference == "fast":
-            return "map_reduce"
-        
-        # Default
-        return "map_reduce"
+        return _select_strategy_cached(total_tokens // 1000, quality_preference)
     
     @staticmethod
     def get_strategy_instance(
@@ -370,38 +636,154 @@ class MultiLevelSummarizer:
         self.model_name = model_name
         self.selector = StrategySelectorr()
     
-    def generate_all_summaries(
+    def _level_strategies(
         self,
         chunks: List[TextChunk],
-        total_tokens: int,
-        style: str = "professional"
-    ) -> Dict[str, SummaryResult]:
-        """Generate all summary levels"""
+        total_tokens: int
+    ) -> Dict[str, BaseSummarizationStrategy]:
+        """Pick the strategy (and model) used for each summary level"""
         
         # Select base strategy
         strategy_name = self.selector.select_strategy(chunks, total_tokens, "balanced")
         
-        summaries = {}
-        
-        # Get model names from settings
-        from config.settings import settings
+        # Default model strategy is shared by bullet and executive levels
+        strategy = self.selector.get_strategy_instance(strategy_name, self.model_name)
         
-        # TL;DR - use fast model
-        fast_strategy = self.selector.get_strategy_instance("stuff", settings.fast_model)
-        summaries['tldr'] = fast_strategy.summarize(chunks, "tldr", style)
+        return {
+            # TL;DR - use fast model
+            'tldr': self.selector.get_strategy_instance("stuff", settings.fast_model),
+            # Bullet Summary - use default model
+            'bullet': strategy,
+            # Executive Summary - use default model
+            'executive': strategy,
+            # Detailed Summary - use premium model for best quality
+            'detailed': self.selector.get_strategy_instance(
+                strategy_name,
+                settings.premium_model
+            ),
+        }
+    
+    def _level_docs(self, chunks: List[TextChunk]) -> Dict[str, List[LangChainDocument]]:
+        """
+        Pick the most relevant chunks for each level (SUMMARY_LEVELS top_k)
         
-        # Bullet Summary - use default model
-        strategy = self.selector.get_strategy_instance(strategy_name, self.model_name)
-        summaries['bullet'] = strategy.summarize(chunks, "bullet", style)
+        Chunks are converted to LangChain documents once and the levels share
+        those documents
+        """
+        # Deterministic document order keeps prompts (and prefix caches) stable
+        chunks = sorted(chunks, key=lambda chunk: chunk.chunk_id)
+        docs = BaseSummarizationStrategy._chunks_to_langchain_docs(chunks)
+        top_ks = {
+            summary_type: config.get('top_k')
+            for summary_type, config in SUMMARY_LEVELS.items()
+        }
         
-        # Executive Summary - use default model
-        summaries['executive'] = strategy.summarize(chunks, "executive", style)
+        # Score once; only needed if some level actually drops chunks
+        scores = None
+        if any(k is not None and k < len(chunks) for k in top_ks.values()):
+            scores = score_chunks(chunks)
         
-        # Detailed Summary - use premium model for best quality
-        premium_strategy = self.selector.get_strategy_instance(
-            strategy_name,
-            settings.premium_model
+        return {
+            summary_type: select_top_k_chunks(docs, k, scores)
+            for summary_type, k in top_ks.items()
+        }
+    
+    def _map_step_docs(
+        self,
+        strategies: Dict[str, BaseSummarizationStrategy],
+        level_docs: Dict[str, List[LangChainDocument]]
+    ) -> List[LangChainDocument]:
+        """
+        Chunks the shared map step must cover - every level selects from the
+        same ranking, so the largest map-reduce selection contains the others
+        """
+        return max(
+            (
+                level_docs[summary_type]
+                for summary_type, strategy in strategies.items()
+                if isinstance(strategy, MapReduceStrategy)
+            ),
+            key=len
         )
-        summaries['detailed'] = premium_strategy.summarize(chunks, "detailed", style)
+    
+    def generate_all_summaries(
+        self,
+        chunks: List[TextChunk],
+        total_tokens: int,
+        style: str = "professional",
+        map_cache: Optional[Dict[str, str]] = None
+    ) -> Dict[str, SummaryResult]:
+        """
+        Generate all summary levels
+        
+        For map-reduce documents the per-chunk map summaries are computed
+        once and shared by every level, so only the reduce step differs.
+        
+        The levels are independent network calls, so this runs
+        agenerate_all_summaries on the shared background loop, which the
+        pooled async clients stay bound to. From inside a running loop
+        (where blocking on it is not possible) the levels are generated one
+        after another instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return run_async(
+                self.agenerate_all_summaries(chunks, total_tokens, style, map_cache)
+            )
+        
+        strategies = self._level_strategies(chunks, total_tokens)
+        level_docs = self._level_docs(chunks)
+        
+        if isinstance(strategies['bullet'], MapReduceStrategy):
+            map_cache = strategies['bullet'].map_docs(
+                self._map_step_docs(strategies, level_docs),
+                map_cache
+            )
+        
+        return {
+            summary_type: strategy.summarize_docs(
+                level_docs[summary_type], summary_type, style, map_cache=map_cache
+            )
+            for summary_type, strategy in strategies.items()
+        }
+    
+    async def agenerate_all_summaries(
+        self,
+        chunks: List[TextChunk],
+        total_tokens: int,
+        style: str = "professional",
+        map_cache: Optional[Dict[str, str]] = None
+    ) -> Dict[str, SummaryResult]:
+        """
+        Generate all summary levels concurrently
+        
+        The LLM calls are pure network I/O, so the four levels are awaited
+        together (bounded by settings.max_concurrent_jobs). The TL;DR runs
+        alongside the shared map step; map-reduce levels wait for it.
+        """
+        strategies = self._level_strategies(chunks, total_tokens)
+        level_docs = self._level_docs(chunks)
+        semaphore = asyncio.Semaphore(settings.max_concurrent_jobs)
+        
+        map_step = None
+        if isinstance(strategies['bullet'], MapReduceStrategy):
+            map_cache = {} if map_cache is None else map_cache
+            map_step = asyncio.ensure_future(strategies['bullet'].amap_docs(
+                self._map_step_docs(strategies, level_docs),
+                map_cache
+            ))
         
-        return summaries
+        async def run_level(summary_type: str, strategy: BaseSummarizationStrategy):
+            if map_step is not None and isinstance(strategy, MapReduceStrategy):
+                await map_step
+            async with semaphore:
+                return await strategy.asummarize_docs(
+                    level_docs[summary_type], summary_type, style, map_cache=map_cache
+                )
+        
+        results = await asyncio.gather(*(
+            run_level(summary_type, strategy)
+            for summary_type, strategy in strategies.items()
+        ))
+        return dict(zip(strategies, results))
@@ -0,0 +1,34 @@
+"""
+Async runner - executes coroutines from synchronous (Streamlit) code
+Uses one long-lived background event loop so async HTTP clients cached on
+model instances stay bound to a live loop across reruns
+"""
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get (starting on first use) the shared background event loop"""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=_loop.run_forever,
+                name="documind-async",
+                daemon=True
+            )
+            thread.start()
+    return _loop
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the background loop and block until it finishes"""
+    future = asyncio.run_coroutine_threadsafe(coro, get_background_loop())
+    return future.result()
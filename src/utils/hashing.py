@@ -0,0 +1,23 @@
+"""
+Content hashing for cache keys
+Uses blake3 when installed and falls back to hashlib's blake2b otherwise
+"""
+import hashlib
+from typing import Union
+
+try:
+    import blake3
+except ImportError:  # pragma: no cover - optional dependency
+    blake3 = None
+
+DIGEST_SIZE = 16
+
+
+def content_hash(data: Union[bytes, str]) -> str:
+    """Hex digest (128-bit) of text or raw bytes, for cache keys only"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    
+    if blake3 is not None:
+        return blake3.blake3(data).hexdigest(length=DIGEST_SIZE)
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest()
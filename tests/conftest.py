@@ -52,6 +52,22 @@ def sample_sections():
     ]
 
 
+@pytest.fixture(scope="session")
+def pdf_processor():
+    """PDF processor shared by all tests (processors hold no per-call state)"""
+    from src.processors.document_processor import PDFProcessor
+    
+    return PDFProcessor()
+
+
+@pytest.fixture(scope="session")
+def text_processor():
+    """Text/markdown processor shared by all tests"""
+    from src.processors.document_processor import TextProcessor
+    
+    return TextProcessor()
+
+
 @pytest.fixture
 def mock_groq_api_key(monkeypatch):
     """Mock Groq API key for testing"""
@@ -64,3 +80,39 @@ def temp_upload_dir(tmp_path):
     upload_dir = tmp_path / "uploads"
     upload_dir.mkdir()
     return upload_dir
+
+
+@pytest.fixture
+def multipage_pdf(tmp_path):
+    """A 12-page PDF whose page N reads "Page N of the test document" """
+    page_count = 12
+    # Objects: 1 catalog, 2 page tree, 3 font, then a page and its content stream per page
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            b" ".join(b"%d 0 R" % (4 + 2 * i) for i in range(page_count)),
+            page_count
+        ),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+    ]
+    for i in range(page_count):
+        stream = b"BT /F1 12 Tf 72 720 Td (Page %d of the test document) Tj ET" % (i + 1)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (5 + 2 * i)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+    
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, obj)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    
+    path = tmp_path / "pages.pdf"
+    path.write_bytes(bytes(pdf))
+    return path
@@ -0,0 +1,53 @@
+"""
+Test suite for the Streamlit app (run headless with streamlit's AppTest)
+"""
+from pathlib import Path
+
+import pytest
+from langchain.globals import get_llm_cache, set_llm_cache
+from streamlit.testing.v1 import AppTest
+
+from src.strategies.summarization_strategies import SummaryResult
+
+APP_PATH = str(Path(__file__).parent.parent / "app.py")
+
+
+@pytest.fixture
+def app():
+    """App script, not run yet (the LLM cache it installs is removed after)"""
+    previous = get_llm_cache()
+    yield AppTest.from_file(APP_PATH, default_timeout=60)
+    set_llm_cache(previous)
+
+
+class TestApp:
+    """Test the app renders across reruns"""
+    
+    def test_smoke(self, app):
+        """Test the app renders and reruns without errors before any upload"""
+        app.run()
+        assert not app.exception
+        assert [selectbox.label for selectbox in app.selectbox] == ["Select Model", "Writing Style"]
+        
+        app.run()
+        assert not app.exception
+    
+    def test_export_without_upload(self, app):
+        """Test earlier summaries still export once the uploader is empty"""
+        app.session_state.summaries = {
+            summary_type: SummaryResult(
+                content=f"{summary_type} summary",
+                summary_type=summary_type,
+                strategy_used="stuff",
+                model_used="default",
+                total_chunks=1,
+                metadata={}
+            )
+            for summary_type in ("tldr", "bullet", "executive", "detailed")
+        }
+        app.session_state.summarized_filename = "report.pdf"
+        
+        app.run()
+        
+        assert not app.exception
+        assert any(header.value == "💾 Export" for header in app.header)
@@ -0,0 +1,80 @@
+"""
+Test suite for relevance-based chunk selection
+"""
+import numpy as np
+
+from src.core.chunk_selection import score_chunks, select_top_k_chunks
+from src.core.chunking_engine import TextChunk
+
+
+def make_chunks(texts):
+    """TextChunks with the given contents, in order"""
+    return [TextChunk(content=text, chunk_id=i, token_count=0) for i, text in enumerate(texts)]
+
+
+class TestScoreChunks:
+    """Test TF-IDF centrality scores"""
+    
+    def test_representative_chunk_scores_highest(self):
+        """Test a chunk sharing the document's terms outranks an outlier"""
+        chunks = make_chunks([
+            "Revenue growth drove quarterly profit and revenue margins.",
+            "Quarterly revenue growth and profit margins improved again.",
+            "Profit and revenue growth were strong this quarterly period.",
+            "Penguins waddle across antarctic glaciers.",
+        ])
+        
+        scores = score_chunks(chunks)
+        
+        assert scores.shape == (4,)
+        assert scores.argmin() == 3
+        assert min(scores[:3]) > scores[3]
+    
+    def test_stopwords_and_short_terms_ignored(self):
+        """Test chunks made only of stopwords and short terms score zero"""
+        chunks = make_chunks(["the and of to", "it is an ox", "Revenue growth"])
+        
+        scores = score_chunks(chunks)
+        
+        assert scores[0] == 0 and scores[1] == 0
+        assert scores[2] > 0
+
+
+class TestSelectTopKChunks:
+    """Test top-k selection"""
+    
+    def test_keeps_all_without_k(self):
+        """Test k=None or k >= len(chunks) returns the chunks unchanged"""
+        chunks = make_chunks(["one alpha", "two beta"])
+        
+        assert select_top_k_chunks(chunks, None) is chunks
+        assert select_top_k_chunks(chunks, 2) is chunks
+        assert select_top_k_chunks(chunks, 5) is chunks
+    
+    def test_top_k_in_document_order(self):
+        """Test the k best chunks are returned in their original order"""
+        items = ["a", "b", "c", "d", "e"]
+        scores = np.array([0.1, 0.9, 0.3, 0.8, 0.2])
+        
+        assert select_top_k_chunks(items, 3, scores) == ["b", "c", "d"]
+        assert select_top_k_chunks(items, 1, scores) == ["b"]
+    
+    def test_ties_keep_earlier_chunks(self):
+        """Test equal scores are broken by document order, stably"""
+        items = ["a", "b", "c", "d"]
+        scores = np.array([0.5, 0.7, 0.5, 0.5])
+        
+        assert select_top_k_chunks(items, 2, scores) == ["a", "b"]
+        assert select_top_k_chunks(items, 3, scores) == ["a", "b", "c"]
+    
+    def test_scores_computed_when_not_given(self):
+        """Test TextChunks are scored on the fly and the outlier is dropped"""
+        chunks = make_chunks([
+            "Revenue growth drove quarterly profit.",
+            "Penguins waddle across antarctic glaciers.",
+            "Quarterly revenue growth and profit margins.",
+        ])
+        
+        selected = select_top_k_chunks(chunks, 2)
+        
+        assert [chunk.chunk_id for chunk in selected] == [0, 2]
@@ -0,0 +1,216 @@
+"""
+Test suite for the chunking engine
+"""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.core.chunking_engine import ChunkingEngine
+from src.core.token_counter import TikTokenCounter
+from src.processors.document_processor import DocumentSection, ProcessedDocument
+
+
+def make_document(sections):
+    """ProcessedDocument from (title, content) pairs"""
+    document_sections = [
+        DocumentSection(title=title, content=content, level=1)
+        for title, content in sections
+    ]
+    full_text = "\n\n".join(content for _, content in sections)
+    return ProcessedDocument(
+        filename="test.txt",
+        file_type="txt",
+        full_text=full_text,
+        sections=document_sections,
+        metadata={},
+        tables=[],
+        total_chars=len(full_text),
+        total_words=len(full_text.split())
+    )
+
+
+@pytest.fixture
+def long_document():
+    """Document with one section that fits a chunk and one that must be split"""
+    paragraphs = [
+        " ".join(f"Sentence {p}.{s} talks about topic {p} in some detail." for s in range(6))
+        for p in range(40)
+    ]
+    return make_document([
+        ("Short", "A short section that fits in one chunk."),
+        ("Long", "\n\n".join(paragraphs)),
+    ])
+
+
+class TestChunkingEngineConcurrency:
+    """Test one engine can be shared between sessions"""
+    
+    def test_concurrent_chunk_document(self, long_document):
+        """Test concurrent calls on a shared engine match sequential results"""
+        engine = ChunkingEngine(chunk_size=120, chunk_overlap=20)
+        expected = [chunk.content for chunk in engine.chunk_document(long_document).chunks]
+        
+        def run(_):
+            return [chunk.content for chunk in engine.chunk_document(long_document).chunks]
+        
+        # Switch threads as often as possible so the calls interleave
+        previous = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(run, range(32)))
+        finally:
+            sys.setswitchinterval(previous)
+        
+        assert all(result == expected for result in results)
+
+
+class CallCountingCounter(TikTokenCounter):
+    """tiktoken counter that records how many texts it counted"""
+    
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+    
+    def count(self, text):
+        self.calls += 1
+        return super().count(text)
+
+
+class TestOptimizeChunkSize:
+    """Test chunk size selection from the document's token total"""
+    
+    def test_short_document_not_tokenized(self):
+        """Test a clearly short document gets small chunks without being counted"""
+        counter = CallCountingCounter()
+        engine = ChunkingEngine(token_counter=counter)
+        document = make_document([("Intro", "A few words. " * 50)])
+        
+        assert engine.optimize_chunk_size(document) == 500
+        assert counter.calls == 0
+    
+    def test_very_long_document_not_tokenized(self):
+        """Test a clearly long document gets large chunks without being counted"""
+        counter = CallCountingCounter()
+        engine = ChunkingEngine(token_counter=counter)
+        document = make_document([("Body", "Some words here. " * 40000)])
+        
+        assert engine.optimize_chunk_size(document) == 2000
+        assert counter.calls == 0
+    
+    def test_ambiguous_document_counted_exactly(self):
+        """Test the exact count decides when a bracket boundary is in range"""
+        counter = CallCountingCounter()
+        engine = ChunkingEngine(token_counter=counter)
+        # 24000 characters could be 4000-8000 tokens, and the 4-characters-
+        # per-token estimate (6000) would pick the wrong bracket
+        document = make_document([("Body", "word " * 4800)])
+        assert TikTokenCounter().count(document.full_text) < 5000
+        
+        assert engine.optimize_chunk_size(document) == 500
+        assert counter.calls == 1
+
+
+class TestSplitLongSection:
+    """Test splitting of sections longer than one chunk"""
+    
+    @pytest.mark.parametrize("chunk_size,chunk_overlap", [(120, 20), (60, 30), (200, 0)])
+    def test_no_chunk_exceeds_chunk_size(self, long_document, chunk_size, chunk_overlap):
+        """Test every chunk fits and its token count matches its content"""
+        engine = ChunkingEngine(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+        chunks = engine.chunk_document(long_document).chunks
+        
+        assert len(chunks) > 2
+        for chunk in chunks:
+            assert chunk.token_count <= chunk_size
+            assert chunk.token_count == engine.count_tokens(chunk.content)
+    
+    def test_overlap_respected(self, long_document):
+        """Test each split chunk starts with the end of the previous one"""
+        engine = ChunkingEngine(chunk_size=120, chunk_overlap=20)
+        chunks = [
+            chunk for chunk in engine.chunk_document(long_document).chunks
+            if chunk.section_title == "Long"
+        ]
+        
+        for previous, chunk in zip(chunks, chunks[1:]):
+            shared = max(
+                length for length in range(len(chunk.content) + 1)
+                if previous.content.endswith(chunk.content[:length])
+            )
+            # The overlap starts on a word boundary, so it may be a word short
+            assert 10 <= engine.count_tokens(chunk.content[:shared]) <= 20
+    
+    def test_sentence_longer_than_chunk_size(self):
+        """Test a single sentence over chunk_size is split between words"""
+        words = [f"word{i}" for i in range(400)]
+        document = make_document([("Run-on", " ".join(words))])
+        engine = ChunkingEngine(chunk_size=50, chunk_overlap=0)
+        chunks = engine.chunk_document(document).chunks
+        
+        assert len(chunks) > 1
+        assert all(chunk.token_count <= 50 for chunk in chunks)
+        assert " ".join(chunk.content for chunk in chunks).split() == words
+    
+    def test_token_count_with_whitespace_runs(self):
+        """Test token counts stay exact when the overlap and the last word sit in whitespace runs"""
+        content = (
+            "—\n  \nbeta.\n\n \n东京大学 —\n   东京大学 东京大学 gamma! 1.51.5 " + "x" * 60
+            + " \n\n \n\n \n \n\n\n\n\n\n   \t\n  \n  \n\n\n\n  \n"
+        )
+        engine = ChunkingEngine(chunk_size=50, chunk_overlap=5)
+        chunks = engine.chunk_document(make_document([("Runs", content)])).chunks
+        
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert chunk.token_count <= 50
+            assert chunk.token_count == engine.count_tokens(chunk.content)
+    
+    def test_empty_and_whitespace_sections(self):
+        """Test empty and whitespace-only sections do not produce text chunks"""
+        document = make_document([
+            ("Empty", ""),
+            ("Blank", "  \n\n  "),
+            ("Long blank", "\n\n" * 5000),
+            ("Text", "Some actual text."),
+        ])
+        engine = ChunkingEngine(chunk_size=100, chunk_overlap=20)
+        chunks = engine.chunk_document(document).chunks
+        
+        assert [chunk.section_title for chunk in chunks if chunk.content.strip()] == ["Text"]
+        assert all(chunk.section_title != "Long blank" for chunk in chunks)
+
+
+class TestBaselineStrategies:
+    """Test fixed and section chunks match the original token-based output"""
+    
+    def test_fixed_chunks(self, long_document):
+        """Test fixed chunks are the decoded token windows"""
+        engine = ChunkingEngine(chunk_size=100, chunk_overlap=25)
+        encoding = TikTokenCounter().encoding
+        tokens = encoding.encode(long_document.full_text)
+        expected = [
+            (encoding.decode(tokens[i:i + 100]), len(tokens[i:i + 100]))
+            for i in range(0, len(tokens), 75)
+        ]
+        
+        chunks = engine.chunk_document(long_document, strategy="fixed").chunks
+        
+        assert [(chunk.content, chunk.token_count) for chunk in chunks] == expected
+        assert [chunk.chunk_id for chunk in chunks] == list(range(len(expected)))
+    
+    def test_section_chunks(self, long_document):
+        """Test section chunks are the sections with their token counts"""
+        engine = ChunkingEngine()
+        encoding = TikTokenCounter().encoding
+        expected = [
+            (section.title, section.content, len(encoding.encode(section.content)))
+            for section in long_document.sections
+        ]
+        
+        chunks = engine.chunk_document(long_document, strategy="section").chunks
+        
+        assert [
+            (chunk.section_title, chunk.content, chunk.token_count) for chunk in chunks
+        ] == expected
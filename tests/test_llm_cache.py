@@ -0,0 +1,59 @@
+"""
+Test suite for the persistent LLM cache
+"""
+from datetime import datetime, timedelta
+
+from langchain_core.outputs import Generation
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from src.models.llm_cache import TTLSQLiteCache
+
+
+def _age_entries(cache: TTLSQLiteCache, hours: int):
+    """Move every entry's creation time the given number of hours back"""
+    with Session(cache.engine) as session, session.begin():
+        session.execute(update(cache.cache_schema).values(
+            created_at=datetime.utcnow() - timedelta(hours=hours)
+        ))
+
+
+class TestTTLSQLiteCache:
+    """Test time-based expiry of cached generations"""
+    
+    def test_lookup_hit(self, tmp_path):
+        """Test a fresh entry is served"""
+        cache = TTLSQLiteCache(tmp_path / "cache.sqlite", ttl_hours=24)
+        cache.update("prompt", "llm", [Generation(text="summary")])
+        
+        result = cache.lookup("prompt", "llm")
+        
+        assert [g.text for g in result] == ["summary"]
+        assert cache.lookup("prompt", "other llm") is None
+    
+    def test_expired_entry_not_served(self, tmp_path):
+        """Test entries past the TTL are misses without a restart"""
+        cache = TTLSQLiteCache(tmp_path / "cache.sqlite", ttl_hours=24)
+        cache.update("prompt", "llm", [Generation(text="summary")])
+        _age_entries(cache, 25)
+        
+        assert cache.lookup("prompt", "llm") is None
+    
+    def test_update_refreshes_expired_entry(self, tmp_path):
+        """Test rewriting an expired entry restarts its TTL"""
+        cache = TTLSQLiteCache(tmp_path / "cache.sqlite", ttl_hours=24)
+        cache.update("prompt", "llm", [Generation(text="old")])
+        _age_entries(cache, 25)
+        cache.update("prompt", "llm", [Generation(text="new")])
+        
+        assert [g.text for g in cache.lookup("prompt", "llm")] == ["new"]
+    
+    def test_prune_expired(self, tmp_path):
+        """Test pruning deletes only expired entries"""
+        cache = TTLSQLiteCache(tmp_path / "cache.sqlite", ttl_hours=24)
+        cache.update("old", "llm", [Generation(text="a")])
+        _age_entries(cache, 25)
+        cache.update("fresh", "llm", [Generation(text="b")])
+        
+        assert cache.prune_expired() == 1
+        assert cache.lookup("fresh", "llm") is not None
@@ -1,7 +1,9 @@
 """
 Test suite for document processors
 """
+import io
 import pytest
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from src.processors.document_processor import (
     PDFProcessor,
@@ -11,6 +13,13 @@ from src.processors.document_processor import (
 )
 
 
+def pdf_workers():
+    """PDF_WORKERS as seen by the calling process"""
+    from src.processors import document_processor
+    
+    return document_processor.PDF_WORKERS
+
+
 class TestPDFProcessor:
     """Test PDF document processing"""
     
@@ -19,9 +28,9 @@ class TestPDFProcessor:
         processor = PDFProcessor()
         assert processor is not None
     
-    def test_extract_sections(self):
+    def test_extract_sections(self, pdf_processor):
         """Test section extraction from text"""
-        processor = PDFProcessor()
+        processor = pdf_processor
         text = """
 # Introduction
 This is the introduction.
@@ -36,12 +45,61 @@ This is the conclusion.
         assert len(sections) > 0
         assert any('Introduction' in s.title for s in sections)
     
-    def test_count_words(self):
+    def test_count_words(self, pdf_processor):
         """Test word counting"""
-        processor = PDFProcessor()
+        processor = pdf_processor
         text = "This is a test document with ten words total."
         count = processor.count_words(text)
         assert count == 9  # "ten" is one word
+    
+    @pytest.mark.parametrize("text", [
+        "",
+        "   \n\t ",
+        "foo\xa0bar",
+        "hello,world",
+        "a - b",
+        "caf\u00e9 na\u00efve\u3000r\u00e9sum\u00e9",
+        "line one\r\nline two\x1cthree",
+        "\u2028a\u2029\u0085b\u200a\u3000\u00e9\u00a0\u1680",
+    ])
+    def test_count_words_matches_str_split(self, pdf_processor, text):
+        """Test words are whitespace-separated, Unicode whitespace included"""
+        assert pdf_processor.count_words(text) == len(text.split())
+    
+    def test_batch_count_words(self, pdf_processor):
+        """Test batch counts match count_words text by text, in order"""
+        texts = ["", "one", "two words", "caf\u00e9\u3000na\u00efve r\u00e9sum\u00e9", "  \n\t "]
+        
+        assert PDFProcessor.batch_count_words(texts) == [pdf_processor.count_words(t) for t in texts]
+        assert PDFProcessor.batch_count_words([]) == []
+    
+    def test_parallel_page_extraction(self, multipage_pdf, monkeypatch):
+        """Test pages extracted in worker processes match serial extraction, in order"""
+        from src.processors import document_processor
+        
+        contexts = []
+        
+        class RecordingExecutor(ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                contexts.append(kwargs.get('mp_context'))
+                super().__init__(*args, **kwargs)
+        
+        monkeypatch.setattr(document_processor, "ProcessPoolExecutor", RecordingExecutor)
+        processor = PDFProcessor(extract_tables=True)
+        
+        monkeypatch.setattr(document_processor, "PDF_WORKERS", 1)
+        serial = processor.process(multipage_pdf)
+        monkeypatch.setattr(document_processor, "PDF_WORKERS", 3)
+        parallel = processor.process(multipage_pdf)
+        with open(multipage_pdf, 'rb') as stream:
+            streamed = processor.process_stream(stream, multipage_pdf.name)
+        
+        assert len(contexts) == 2
+        assert all(context.get_start_method() in ("forkserver", "spawn") for context in contexts)
+        assert parallel.metadata['total_pages'] == 12
+        assert parallel.full_text == serial.full_text == streamed.full_text
+        positions = [parallel.full_text.index(f"Page {n} of the test document") for n in range(1, 13)]
+        assert positions == sorted(positions)
 
 
 class TestDOCXProcessor:
@@ -61,9 +119,9 @@ class TestTextProcessor:
         processor = TextProcessor()
         assert processor is not None
     
-    def test_markdown_detection(self):
+    def test_markdown_detection(self, text_processor):
         """Test markdown file detection"""
-        processor = TextProcessor()
+        processor = text_processor
         # This would need actual file testing
         assert processor is not None
 
@@ -91,10 +149,67 @@ class TestDocumentProcessorFactory:
         processor = DocumentProcessorFactory.get_processor(Path("test.md"))
         assert isinstance(processor, TextProcessor)
     
+    def test_get_processor_cls(self):
+        """Test factory returns processor classes without instantiating them"""
+        get_cls = DocumentProcessorFactory.get_processor_cls
+        assert get_cls(Path("test.pdf")) is PDFProcessor
+        assert get_cls(Path("test.docx")) is DOCXProcessor
+        assert get_cls("test.txt") is TextProcessor
+        assert get_cls("test.MD") is TextProcessor
+        with pytest.raises(ValueError):
+            get_cls("test.xyz")
+    
     def test_unsupported_file_type(self):
         """Test factory raises error for unsupported file types"""
         with pytest.raises(ValueError):
             DocumentProcessorFactory.get_processor(Path("test.xyz"))
+    
+    def test_process_stream_markdown(self, sample_text):
+        """Test in-memory documents are processed without a file on disk"""
+        stream = io.BytesIO(sample_text.encode('utf-8'))
+        doc = DocumentProcessorFactory.process_stream(stream, "notes.md")
+        
+        assert doc.filename == "notes.md"
+        assert doc.file_type == "md"
+        assert doc.metadata['is_markdown'] is True
+        assert any('Introduction' in s.title for s in doc.sections)
+    
+    def test_process_many(self, tmp_path, sample_text):
+        """Test several documents are processed in worker processes, in order"""
+        paths = []
+        for name in ("a.txt", "b.md", "c.txt"):
+            path = tmp_path / name
+            path.write_text(sample_text, encoding='utf-8')
+            paths.append(path)
+        
+        docs = DocumentProcessorFactory.process_many(paths, max_workers=2)
+        
+        assert [doc.filename for doc in docs] == ["a.txt", "b.md", "c.txt"]
+        assert all(any('Introduction' in s.title for s in doc.sections) for doc in docs)
+    
+    def test_process_many_workers_extract_pages_serially(self, tmp_path, sample_text, monkeypatch):
+        """Test process_many workers do not start nested PDF page pools"""
+        from src.processors import document_processor
+        
+        initializers = []
+        
+        class RecordingExecutor(ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                initializers.append(kwargs.get('initializer'))
+                super().__init__(*args, **kwargs)
+        
+        monkeypatch.setattr(document_processor, "ProcessPoolExecutor", RecordingExecutor)
+        paths = []
+        for name in ("a.txt", "b.txt"):
+            path = tmp_path / name
+            path.write_text(sample_text, encoding='utf-8')
+            paths.append(path)
+        
+        DocumentProcessorFactory.process_many(paths, max_workers=2)
+        
+        assert initializers == [document_processor._serial_page_extraction]
+        with ProcessPoolExecutor(max_workers=1, initializer=initializers[0]) as executor:
+            assert executor.submit(pdf_workers).result() == 1
 
 
 class TestDocumentSection:
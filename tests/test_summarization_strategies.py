@@ -0,0 +1,144 @@
+"""
+Test suite for summarization strategies (with a fake LLM, no network calls)
+"""
+import asyncio
+from collections import OrderedDict
+
+import pytest
+from langchain.globals import get_llm_cache, set_llm_cache
+from langchain_core.language_models.llms import LLM
+
+from src.core.chunking_engine import TextChunk
+from src.strategies import summarization_strategies
+from src.strategies.summarization_strategies import MapReduceStrategy, MultiLevelSummarizer
+
+
+class FakeLLM(LLM):
+    """LLM that answers every prompt with its length and records its calls"""
+    
+    temperature: float = 0.3
+    prompts: list = []
+    loops: list = []
+    
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+    
+    def _call(self, prompt, stop=None, run_manager=None, **kwargs) -> str:
+        self.prompts.append(prompt)
+        return f"summary of {len(prompt)} characters"
+    
+    async def _acall(self, prompt, stop=None, run_manager=None, **kwargs) -> str:
+        self.loops.append(asyncio.get_running_loop())
+        return self._call(prompt, stop, run_manager, **kwargs)
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """Fake LLM returned for every model, with no LLM response cache installed"""
+    llm = FakeLLM(prompts=[], loops=[])
+    monkeypatch.setattr(
+        summarization_strategies.llm_manager,
+        "get_model",
+        lambda *args, **kwargs: llm
+    )
+    previous = get_llm_cache()
+    set_llm_cache(None)
+    yield llm
+    set_llm_cache(previous)
+
+
+@pytest.fixture
+def map_cache(monkeypatch):
+    """Empty shared map-summary cache, enabled"""
+    monkeypatch.setattr(summarization_strategies.settings, "enable_cache", True)
+    monkeypatch.setattr(summarization_strategies, "_map_summary_cache", OrderedDict())
+    return summarization_strategies._map_summary_cache
+
+
+def make_chunks(count, words=50):
+    """Distinct chunks of roughly words tokens each"""
+    return [
+        TextChunk(content=f"Chunk {i}. " + "word " * words, chunk_id=i, token_count=words)
+        for i in range(count)
+    ]
+
+
+class TestMultiLevelSummarizer:
+    """Test generating every summary level"""
+    
+    def test_sync_calls_share_one_live_loop(self, fake_llm):
+        """Test repeated sync calls run on the same event loop, left open"""
+        summarizer = MultiLevelSummarizer()
+        chunks = make_chunks(3)
+        
+        for _ in range(2):
+            summaries = summarizer.generate_all_summaries(chunks, total_tokens=150)
+            assert set(summaries) == {'tldr', 'bullet', 'executive', 'detailed'}
+        
+        assert len(set(fake_llm.loops)) == 1
+        assert not fake_llm.loops[0].is_closed()
+
+
+class TestSharedMapSummaryCache:
+    """Test map summaries are shared across runs through the module cache"""
+    
+    def test_miss_then_hit(self, fake_llm, map_cache):
+        """Test a second run maps nothing and returns the same summaries"""
+        chunks = make_chunks(3)
+        
+        first = MapReduceStrategy().map_chunks(chunks)
+        assert len(fake_llm.prompts) == 3
+        assert len(map_cache) == 3
+        
+        fake_llm.prompts.clear()
+        second = MapReduceStrategy().map_chunks(chunks)
+        assert fake_llm.prompts == []
+        assert second == first
+    
+    def test_key_includes_model(self, fake_llm, map_cache):
+        """Test summaries from another model are not reused"""
+        chunks = make_chunks(2)
+        MapReduceStrategy(model_name="model-a").map_chunks(chunks)
+        fake_llm.prompts.clear()
+        
+        MapReduceStrategy(model_name="model-b").map_chunks(chunks)
+        
+        assert len(fake_llm.prompts) == 2
+    
+    def test_key_includes_temperature(self, fake_llm, map_cache):
+        """Test summaries from another temperature are not reused"""
+        chunks = make_chunks(2)
+        MapReduceStrategy().map_chunks(chunks)
+        
+        strategy = MapReduceStrategy()
+        strategy.llm = FakeLLM(temperature=0.9, prompts=[], loops=[])
+        strategy.map_chunks(chunks)
+        
+        assert len(strategy.llm.prompts) == 2
+    
+    def test_key_includes_prompt(self, fake_llm, map_cache, monkeypatch):
+        """Test summaries from another map prompt are not reused"""
+        chunks = make_chunks(2)
+        MapReduceStrategy().map_chunks(chunks)
+        fake_llm.prompts.clear()
+        
+        monkeypatch.setattr(summarization_strategies, "_MAP_PROMPT_HASH", "changed")
+        MapReduceStrategy().map_chunks(chunks)
+        
+        assert len(fake_llm.prompts) == 2
+    
+    def test_eviction_at_map_cache_size(self, fake_llm, map_cache, monkeypatch):
+        """Test least recently used summaries go first beyond map_cache_size"""
+        monkeypatch.setattr(summarization_strategies.settings, "map_cache_size", 2)
+        chunks = make_chunks(3)
+        
+        MapReduceStrategy().map_chunks(chunks)
+        assert len(map_cache) == 2
+        
+        fake_llm.prompts.clear()
+        MapReduceStrategy().map_chunks(chunks[1:])
+        assert fake_llm.prompts == []
+        
+        MapReduceStrategy().map_chunks(chunks[:1])
+        assert len(fake_llm.prompts) == 1
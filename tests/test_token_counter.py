@@ -0,0 +1,90 @@
+"""
+Test suite for token counters
+"""
+import pytest
+
+from src.core.chunking_engine import ChunkingEngine
+from src.core.token_counter import HFTokenizerCounter, TikTokenCounter
+from src.processors.document_processor import DocumentSection, ProcessedDocument
+
+
+@pytest.fixture
+def word_tokenizer_path(tmp_path):
+    """tokenizer.json of a word-level HuggingFace tokenizer (one token per word)"""
+    tokenizers = pytest.importorskip("tokenizers")
+    
+    vocab = {"[UNK]": 0}
+    for word in "the quick brown fox jumps over lazy dog . sentence number".split():
+        vocab[word] = len(vocab)
+    for number in range(100):
+        vocab[str(number)] = len(vocab)
+    
+    tokenizer = tokenizers.Tokenizer(tokenizers.models.WordLevel(vocab, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = tokenizers.pre_tokenizers.Whitespace()
+    tokenizer.decoder = tokenizers.decoders.WordPiece()
+    path = tmp_path / "tokenizer.json"
+    tokenizer.save(str(path))
+    return str(path)
+
+
+class TestTikTokenCounter:
+    """Test the default tiktoken counter"""
+    
+    def test_count_matches_encode(self):
+        """Test counts are the length of the encoded ids"""
+        counter = TikTokenCounter()
+        text = "The quick brown fox jumps over the lazy dog."
+        
+        assert counter.count(text) == len(counter.encode(text)) > 0
+        assert counter.decode(counter.encode(text)) == text
+    
+    def test_batch_matches_single(self):
+        """Test batch counting equals counting texts one by one"""
+        counter = TikTokenCounter()
+        texts = ["one", "two words", "", "A longer sentence with more tokens."]
+        
+        assert counter.count_batch(texts) == [counter.count(text) for text in texts]
+        assert counter.encode_batch(texts) == [counter.encode(text) for text in texts]
+
+
+class TestHFTokenizerCounter:
+    """Test the HuggingFace tokenizers counter"""
+    
+    def test_count(self, word_tokenizer_path):
+        """Test counts follow the tokenizer's own vocabulary"""
+        counter = HFTokenizerCounter(word_tokenizer_path)
+        
+        assert counter.count("the quick brown fox") == 4
+        assert counter.count_batch(["the dog", "lazy dog ."]) == [2, 3]
+    
+    def test_chunk_counts_use_counter(self, word_tokenizer_path):
+        """Test every chunk of a split section is counted with the configured tokenizer"""
+        counter = HFTokenizerCounter(word_tokenizer_path)
+        paragraphs = [
+            " ".join(f"sentence number {p} . the quick brown fox jumps ." for _ in range(4))
+            for p in range(30)
+        ]
+        content = "\n\n".join(paragraphs)
+        full_text = "the lazy dog .\n\n" + content
+        document = ProcessedDocument(
+            filename="test.txt",
+            file_type="txt",
+            full_text=full_text,
+            sections=[
+                DocumentSection(title="Short", content="the lazy dog .", level=1),
+                DocumentSection(title="Long", content=content, level=1),
+            ],
+            metadata={},
+            tables=[],
+            total_chars=len(full_text),
+            total_words=len(full_text.split())
+        )
+        engine = ChunkingEngine(chunk_size=50, chunk_overlap=0, token_counter=counter)
+        
+        chunked = engine.chunk_document(document)
+        
+        assert len(chunked.chunks) > 2
+        assert [chunk.token_count for chunk in chunked.chunks] == [
+            counter.count(chunk.content) for chunk in chunked.chunks
+        ]
+        assert chunked.total_tokens == counter.count(document.full_text)